@@ -14,6 +14,17 @@ from ..project_instructions import ProjectInstructions
 
 logger = logging.getLogger(__name__)
 
+# Listings longer than this are shown through a pager before confirmations
+PAGER_THRESHOLD = 50
+
+
+def _echo_listing(lines, allow_pager=False):
+    """Write a project listing with a single echo, paging long confirmation lists."""
+    if allow_pager and len(lines) > PAGER_THRESHOLD:
+        click.echo_via_pager("\n".join(lines) + "\n")
+    else:
+        click.echo("\n".join(lines))
+
 
 @click.group()
 def project():
@@ -160,8 +171,10 @@ def archive(config, archive_all, yes):
     if archive_all:
         if not yes:
             click.echo("The following projects will be archived:")
-            for project in projects:
-                click.echo(f"  - {project['name']} (ID: {project['id']})")
+            _echo_listing(
+                [f"  - {project['name']} (ID: {project['id']})" for project in projects],
+                allow_pager=True,
+            )
             if not click.confirm("Are you sure you want to archive all projects?"):
                 click.echo("Operation cancelled.")
                 return
@@ -187,8 +200,12 @@ def archive(config, archive_all, yes):
 
 def single_project_archival(projects, yes, provider, active_organization_id):
     click.echo("Available projects to archive:")
-    for idx, project in enumerate(projects, 1):
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']})")
+    _echo_listing(
+        [
+            f"  {idx}. {project['name']} (ID: {project['id']})"
+            for idx, project in enumerate(projects, 1)
+        ]
+    )
 
     selection = click.prompt("Enter the number of the project to archive", type=int)
     if 1 <= selection <= len(projects):
@@ -247,24 +264,27 @@ def set(ctx, show_all, provider):
         active_organization_id, include_archived=False
     )
 
+    submodule_marker = "-SubModule-"
+    submodule_prefix = f"{active_project_name}{submodule_marker}"
+
     if show_all:
         selectable_projects = projects
     else:
         # Filter out submodule projects
-        selectable_projects = [p for p in projects if "-SubModule-" not in p["name"]]
+        selectable_projects = [p for p in projects if submodule_marker not in p["name"]]
 
     if not selectable_projects:
         click.echo("No active projects found.")
         return
 
     click.echo("Available projects:")
+    lines = []
     for idx, project in enumerate(selectable_projects, 1):
         project_type = (
-            "Main Project"
-            if not project["name"].startswith(f"{active_project_name}-SubModule-")
-            else "Submodule"
+            "Submodule" if project["name"].startswith(submodule_prefix) else "Main Project"
         )
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']}) - {project_type}")
+        lines.append(f"  {idx}. {project['name']} (ID: {project['id']}) - {project_type}")
+    _echo_listing(lines)
 
     selection = click.prompt(
         "Enter the number of the project to select", type=int, default=1
@@ -344,9 +364,14 @@ def truncate(config, include_archived, truncate_all, yes):
     if truncate_all:
         if not yes:
             click.echo("This will delete ALL files from the following projects:")
-            for project in projects:
-                status = " (Archived)" if project.get("archived_at") else ""
-                click.echo(f"  - {project['name']} (ID: {project['id']}){status}")
+            _echo_listing(
+                [
+                    f"  - {project['name']} (ID: {project['id']})"
+                    f"{' (Archived)' if project.get('archived_at') else ''}"
+                    for project in projects
+                ],
+                allow_pager=True,
+            )
             if not click.confirm(
                 "Are you sure you want to continue? This may take some time."
             ):
@@ -364,9 +389,13 @@ def truncate(config, include_archived, truncate_all, yes):
         return
 
     click.echo("Available projects:")
-    for idx, project in enumerate(projects, 1):
-        status = " (Archived)" if project.get("archived_at") else ""
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']}){status}")
+    _echo_listing(
+        [
+            f"  {idx}. {project['name']} (ID: {project['id']})"
+            f"{' (Archived)' if project.get('archived_at') else ''}"
+            for idx, project in enumerate(projects, 1)
+        ]
+    )
 
     selection = click.prompt("Enter the number of the project to truncate", type=int)
     if 1 <= selection <= len(projects):
@@ -453,19 +482,46 @@ def select(config, multiple, include_archived, search, sync_selected):
     if sync_selected and len(selected) > 1:
         click.echo("\nSyncing selected projects...")
         
-        import subprocess
         from concurrent.futures import ThreadPoolExecutor, as_completed
+        from ..configmanager import FileConfigManager
+        from ..workspace_config import WorkspaceConfig
+        from ..workspace_manager import WorkspaceManager
+        from .sync import run_sync
+
+        # Map project IDs to their local folders in the saved workspace,
+        # walking it again only if a selected project isn't known yet
+        manager = WorkspaceManager(WorkspaceConfig())
+        project_paths = {p['id']: p['path'] for p in manager.discover_projects(use_cache=True)}
+        if any(p['id'] not in project_paths for p in selected):
+            project_paths = {p['id']: p['path'] for p in manager.discover_projects()}
         
         def sync_project(project):
             """Sync a single project."""
+            project_path = project_paths.get(project['id'])
+            if not project_path:
+                return {
+                    'project': project['name'],
+                    'status': 'skipped',
+                    'message': 'No local folder found in the workspace'
+                }
             try:
-                # Find project directory
-                # This would need workspace management to work properly
-                # For now, we'll just show what would be synced
+                # Quiet, so parallel syncs don't write over the progress bar
+                results = run_sync(
+                    FileConfigManager(project_path),
+                    conflict_strategy='local-wins',
+                    no_pull=True,
+                    quiet=True,
+                )
+                if results and results['errors']:
+                    return {
+                        'project': project['name'],
+                        'status': 'failed',
+                        'message': f"{len(results['errors'])} error(s), first: {results['errors'][0]}"
+                    }
                 return {
                     'project': project['name'],
-                    'status': 'would_sync',
-                    'message': 'Workspace management needed for multi-sync'
+                    'status': 'success',
+                    'message': 'Synced successfully'
                 }
             except Exception as e:
                 return {
@@ -476,14 +532,16 @@ def select(config, multiple, include_archived, search, sync_selected):
         
         # Sync in parallel
         with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(sync_project, p): p for p in selected}
+            futures = [executor.submit(sync_project, p) for p in selected]
             
-            for future in as_completed(futures):
-                result = future.result()
-                if result['status'] == 'success':
-                    click.echo(f"  ✓ {result['project']}")
-                else:
-                    click.echo(f"  ✗ {result['project']}: {result['message']}")
+            with tqdm(total=len(selected), desc="Syncing projects") as pbar:
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result['status'] == 'success':
+                        pbar.write(f"  ✓ {result['project']}")
+                    else:
+                        pbar.write(f"  ✗ {result['project']}: {result['message']}")
+                    pbar.update(1)
     
     elif sync_selected and len(selected) == 1:
         # Set as active and offer to sync
@@ -493,7 +551,8 @@ def select(config, multiple, include_archived, search, sync_selected):
         click.echo(f"\nSet active project: {project['name']}")
         
         if click.confirm("Sync this project now?"):
-            subprocess.run(['csync', 'push'])
+            from .push import push
+            click.get_current_context().invoke(push)
 
 
 @project.group()
@@ -543,14 +602,13 @@ def pull(config):
         click.echo(f"✓ Instructions saved to {instructions.INSTRUCTIONS_FILE}")
         
         # Show preview
-        with open(os.path.join(local_path, instructions.INSTRUCTIONS_FILE), 'r') as f:
-            content = f.read()
-            if content.strip():
-                click.echo("\nPreview:")
-                preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(preview)
-            else:
-                click.echo("\n(No instructions found in project)")
+        content = instructions.read_cached()
+        if content.strip():
+            click.echo("\nPreview:")
+            preview = content[:200] + "..." if len(content) > 200 else content
+            click.echo(preview)
+        else:
+            click.echo("\n(No instructions found in project)")
     else:
         click.echo("✗ Failed to pull instructions")
 
@@ -570,7 +628,7 @@ def push(config):
     
     instructions = ProjectInstructions(local_path)
     
-    if not os.path.exists(os.path.join(local_path, instructions.INSTRUCTIONS_FILE)):
+    if not os.path.exists(instructions.instructions_path):
         click.echo(f"No {instructions.INSTRUCTIONS_FILE} found.")
         click.echo("Run 'csync project instructions init' first.")
         return
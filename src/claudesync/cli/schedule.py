@@ -1,23 +1,40 @@
+import platform
+import subprocess
+
 import click
 
+CRON_COMMENT = '# ClaudeSync'
+
+
+def _rewrite_crontab(new_entry=None):
+    """Drop existing ClaudeSync lines from the user crontab and optionally append one.
+
+    Reads the crontab with ``crontab -l`` and pipes the filtered result back via
+    ``crontab -``, which avoids parsing the whole file just to manage one entry.
+    """
+    current = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
+    # A missing crontab makes 'crontab -l' exit non-zero; treat it as empty
+    lines = current.stdout.splitlines() if current.returncode == 0 else []
+    lines = [line for line in lines if not line.rstrip().endswith(CRON_COMMENT)]
+    if new_entry:
+        lines.append(new_entry)
+
+    new_crontab = '\n'.join(lines) + '\n' if lines else ''
+    subprocess.run(['crontab', '-'], input=new_crontab, text=True, check=True)
+
+
 @click.command()
 @click.option('--interval', type=int, default=5, help='Sync interval in minutes')
 @click.option('--remove', is_flag=True, help='Remove scheduled sync')
 @click.pass_obj
 def schedule(config, interval, remove):
     """Schedule automatic sync at regular intervals."""
-    import platform
-    import subprocess
-
     if remove:
         click.echo('Removing scheduled sync...')
         if platform.system() == 'Windows':
             subprocess.run(['schtasks', '/Delete', '/TN', 'ClaudeSync', '/F'])
         else:
-            from python_crontab import CronTab
-            cron = CronTab(user=True)
-            cron.remove_all(comment='ClaudeSync')
-            cron.write()
+            _rewrite_crontab()
         click.echo('Done. Scheduled sync removed')
         return
 
@@ -27,11 +44,6 @@ def schedule(config, interval, remove):
         cmd = f'schtasks /Create /SC MINUTE /MO {interval} /TN "ClaudeSync" /TR "csync sync" /F'
         subprocess.run(cmd, shell=True)
     else:
-        from python_crontab import CronTab
-        cron = CronTab(user=True)
-        cron.remove_all(comment='ClaudeSync')
-        job = cron.new(command='csync sync', comment='ClaudeSync')
-        job.minute.every(interval)
-        cron.write()
+        _rewrite_crontab(f'*/{interval} * * * * csync sync {CRON_COMMENT}')
 
     click.echo(f'Done. Scheduled sync every {interval} minutes')
@@ -1,13 +1,38 @@
 """Status command for displaying project sync status."""
 
+import bisect
 import click
+import json
+import logging
 import os
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 
 from ..metadatamanager import MetadataManager
 from ..utils import handle_errors, validate_and_get_provider, get_local_files
 
+logger = logging.getLogger(__name__)
+
+ORGANIZATIONS_CACHE_FILE = os.path.expanduser("~/.claudesync/cache/organizations.json")
+ORGANIZATIONS_CACHE_TTL = 3600  # seconds
+
+# Last parsed organizations cache as ((path, mtime_ns, size), contents)
+_organizations_cache_memo = None
+
+GREEN_DOT = "\033[32m●\033[0m"
+RED_DOT = "\033[31m●\033[0m"
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+SIZE_THRESHOLDS = (1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+
+DIRECTION_MAP = {
+    "push": "Push",
+    "pull": "Pull",
+    "both": "Bidirectional"
+}
+
 
 def format_size(size_bytes):
     """Format byte size to human-readable format.
@@ -18,17 +43,21 @@ def format_size(size_bytes):
     Returns:
         Formatted string (e.g., "1.5 MB", "342 KB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            if unit == 'B':
-                return f"{size_bytes:.0f} {unit}"
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    unit_index = bisect.bisect_right(SIZE_THRESHOLDS, size_bytes)
+    if unit_index == 0:
+        return f"{size_bytes:.0f} B"
+    return f"{size_bytes / SIZE_THRESHOLDS[unit_index - 1]:.1f} {SIZE_UNITS[unit_index]}"
+
+
+def pluralize(count, singular, plural=None):
+    """Return the singular or plural form of a noun for the given count."""
+    if count == 1:
+        return singular
+    return plural or f"{singular}s"
 
 
 def print_aligned_rows(rows):
-    """Print rows with aligned labels and values.
+    """Print rows with aligned labels and values in a single write.
 
     Args:
         rows: List of (label, value) tuples
@@ -38,14 +67,72 @@ def print_aligned_rows(rows):
 
     max_label_width = max(len(label) for label, _ in rows)
 
+    lines = []
     for label, value in rows:
         if label:
             padding = ' ' * (max_label_width - len(label) + 1)
-            click.echo(f"{label}:{padding}{value}")
+            lines.append(f"{label}:{padding}{value}")
         else:
             # Empty label - no colon, just indent to align with values
             padding = ' ' * (max_label_width + 2)
-            click.echo(f"{padding}{value}")
+            lines.append(f"{padding}{value}")
+
+    click.echo("\n".join(lines))
+
+
+def _get_organization_name(config, organization_id):
+    """Return the display name of an organization, using the on-disk cache when fresh.
+
+    Organization lists rarely change, so names are cached per provider for
+    ORGANIZATIONS_CACHE_TTL seconds instead of fetched on every status call.
+    """
+    provider_name = config.get("active_provider") or "default"
+    cache = _load_organizations_cache()
+    entry = cache.get(provider_name)
+    if entry and time.time() - entry.get("fetched_at", 0) <= ORGANIZATIONS_CACHE_TTL:
+        # A fresh list without this ID means it is unknown; refetching would not help
+        return entry.get("names", {}).get(organization_id)
+
+    provider = validate_and_get_provider(config, require_project=False)
+    organizations = provider.get_organizations()
+    names = {org['id']: org['name'] for org in organizations}
+    cache[provider_name] = {"fetched_at": time.time(), "names": names}
+    _save_organizations_cache(cache)
+    return names.get(organization_id)
+
+
+def _load_organizations_cache():
+    """Read the organizations cache, reusing the last parse while the file is unchanged."""
+    global _organizations_cache_memo
+    try:
+        stat = os.stat(ORGANIZATIONS_CACHE_FILE)
+        signature = (ORGANIZATIONS_CACHE_FILE, stat.st_mtime_ns, stat.st_size)
+        if _organizations_cache_memo and _organizations_cache_memo[0] == signature:
+            return dict(_organizations_cache_memo[1])
+        with open(ORGANIZATIONS_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    _organizations_cache_memo = (signature, cache)
+    return dict(cache)
+
+
+def _save_organizations_cache(cache):
+    """Write the organizations cache, replacing the file atomically."""
+    cache_dir = os.path.dirname(ORGANIZATIONS_CACHE_FILE)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, ORGANIZATIONS_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write organizations cache: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 @click.command()
@@ -70,38 +157,45 @@ def status(config):
     metadata_manager = MetadataManager(local_path, config=config)
 
     # Check pairing status
-    is_paired = metadata_manager.is_paired()
-    project_name = metadata_manager.get_project_name()
-    organization_id = metadata_manager.get_organization_id()
+    meta = metadata_manager.snapshot()
+    is_paired = meta["is_paired"]
+    project_name = meta["project_name"]
+    organization_id = meta["organization_id"]
+
+    # Nothing else to report for an unpaired project
+    if not is_paired:
+        print_aligned_rows([("Status", f"{RED_DOT} Unpaired")])
+        return
 
     # Get organization name if paired
     org_name = None
-    if is_paired and organization_id:
-        try:
-            provider = validate_and_get_provider(config, require_project=False)
-            organizations = provider.get_organizations()
-            org_match = next((org for org in organizations if org['id'] == organization_id), None)
-            if org_match:
-                org_name = org_match['name']
-        except Exception:
-            pass  # Silently fail if we can't get org name
+    if organization_id:
+        org_name = meta["organization_name"]
+        if org_name is None:
+            # Not recorded yet: look it up once and keep it in the metadata
+            try:
+                org_name = _get_organization_name(config, organization_id)
+                if org_name:
+                    metadata_manager.set_organization_name(organization_id, org_name)
+            except Exception:
+                pass  # Silently fail if we can't get org name
 
     # Build status rows
     status_rows = []
 
     # Status row
-    if is_paired and project_name:
+    if project_name:
         if org_name:
-            status_value = f"\033[32m●\033[0m Paired with project \"{project_name}\" ({org_name})"
+            status_value = f"{GREEN_DOT} Paired with project \"{project_name}\" ({org_name})"
         else:
-            status_value = f"\033[32m●\033[0m Paired with project \"{project_name}\""
+            status_value = f"{GREEN_DOT} Paired with project \"{project_name}\""
     else:
-        status_value = "\033[31m●\033[0m Unpaired"
+        status_value = f"{RED_DOT} Unpaired"
     status_rows.append(("Status", status_value))
 
     # Last sync row
-    last_sync = metadata_manager.get_last_sync()
-    last_sync_direction = metadata_manager.get_last_sync_direction()
+    last_sync = meta["last_sync"]
+    last_sync_direction = meta["last_sync_direction"]
 
     if last_sync:
         try:
@@ -110,24 +204,18 @@ def status(config):
             formatted_time = sync_time.strftime("%Y-%m-%d %H:%M:%S")
 
             # Format direction
-            direction_map = {
-                "push": "Push",
-                "pull": "Pull",
-                "both": "Bidirectional"
-            }
-            direction_display = direction_map.get(last_sync_direction, last_sync_direction or "Unknown")
-            sync_value = f"\033[32m●\033[0m {formatted_time} ({direction_display})"
+            direction_display = DIRECTION_MAP.get(last_sync_direction, last_sync_direction or "Unknown")
+            sync_value = f"{GREEN_DOT} {formatted_time} ({direction_display})"
         except ValueError:
-            sync_value = f"\033[32m●\033[0m {last_sync}"
+            sync_value = f"{GREEN_DOT} {last_sync}"
     else:
-        sync_value = "\033[31m●\033[0m Unsynced"
+        sync_value = f"{RED_DOT} Unsynced"
     status_rows.append(("Last Sync", sync_value))
 
     # Add upload/download stats below Last Sync if available
     if last_sync:
-        sync_history = metadata_manager.get_sync_history(limit=1)
-        if sync_history:
-            last_sync_record = sync_history[0]
+        last_sync_record = meta["last_sync_record"]
+        if last_sync_record:
             files_synced = last_sync_record.get('files_synced', 0)
             direction = last_sync_record.get('direction', '')
 
@@ -149,9 +237,9 @@ def status(config):
             # Build the stats line
             stats_parts = []
             if downloaded > 0:
-                stats_parts.append(f"↓ {downloaded} file{'s' if downloaded != 1 else ''} downloaded")
+                stats_parts.append(f"↓ {downloaded} {pluralize(downloaded, 'file')} downloaded")
             if uploaded > 0:
-                stats_parts.append(f"↑ {uploaded} file{'s' if uploaded != 1 else ''} uploaded")
+                stats_parts.append(f"↑ {uploaded} {pluralize(uploaded, 'file')} uploaded")
 
             if stats_parts:
                 stats_line = ", ".join(stats_parts)
@@ -159,34 +247,28 @@ def status(config):
 
     print_aligned_rows(status_rows)
 
-    # Only show file/submodule counts if paired
-    if is_paired:
-        click.echo()
+    click.echo()
 
-        # Build count rows
-        count_rows = []
+    # Build count rows
+    count_rows = []
 
-        # Count local files and calculate total size
-        try:
-            local_files = get_local_files(config, local_path)
-            file_count = len(local_files)
-
-            # Calculate total size
-            total_size = 0
-            for file_path in local_files.keys():
-                full_path = os.path.join(local_path, file_path)
-                if os.path.exists(full_path):
-                    total_size += os.path.getsize(full_path)
-
-            size_str = format_size(total_size)
-            count_rows.append(("Local Files", f"{file_count} ({size_str})"))
-        except Exception as e:
-            count_rows.append(("Local Files", f"Unable to count ({str(e)})"))
-
-        # Count submodules
-        submodules = config.get("submodules", [])
-        submodule_count = len(submodules) if submodules else 0
-        count_rows.append(("Submodules", str(submodule_count)))
-
-        # Print count rows
-        print_aligned_rows(count_rows)
+    # Count local files and calculate total size
+    try:
+        # Sizes come from the walk's own stat calls, so no second pass is needed
+        file_sizes = {}
+        local_files = get_local_files(config, local_path, sizes=file_sizes)
+        file_count = len(local_files)
+        total_size = sum(file_sizes.values())
+
+        size_str = format_size(total_size)
+        count_rows.append(("Local Files", f"{file_count} ({size_str})"))
+    except Exception as e:
+        count_rows.append(("Local Files", f"Unable to count ({str(e)})"))
+
+    # Count submodules
+    submodules = config.get("submodules", [])
+    submodule_count = len(submodules) if submodules else 0
+    count_rows.append(("Submodules", str(submodule_count)))
+
+    # Print count rows
+    print_aligned_rows(count_rows)
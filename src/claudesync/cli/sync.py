@@ -1,30 +1,60 @@
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
 import click
-from ..syncmanager import SyncManager, SyncDirection
-from ..utils import handle_errors, validate_and_get_provider, get_local_files
+from ..exceptions import ConfigurationError, SyncConflictError
+from ..syncmanager import PlanItem, SyncDirection, SyncManager, SyncPlan
+from ..utils import handle_errors, validate_and_get_provider, get_local_files_cached
 from ..conflict_resolver import ConflictResolver
 
-def _print_plan(plan):
-    """Print sync plan in human-readable format."""
+PLAN_ICONS = {
+    "upload": "⬆️ ",
+    "download": "⬇️ ",
+    "delete_local": "🗑️ ",
+    "delete_remote": "🗑️ ",
+    "noop": "⏭️ "
+}
+# Full "  <icon> <ACTION>: " line prefixes, so the plan loop only appends the path
+PLAN_PREFIXES = {action: f"  {icon} {action.upper()}: " for action, icon in PLAN_ICONS.items()}
+
+
+def _silent(*args, **kwargs):
+    """Stands in for click.echo when run_sync is asked to be quiet."""
+
+
+def _print_plan(plan, echo=click.echo):
+    """Print sync plan in human-readable format.
+
+    The whole plan is emitted with a single echo rather than two writes per
+    file, which matters for plans covering thousands of files.
+    """
+    lines = []
     if plan.actions:
-        click.echo("\n📋 Planned Actions:")
+        lines.append("\n📋 Planned Actions:")
         for item in plan.actions:
-            icon = {
-                "upload": "⬆️ ",
-                "download": "⬇️ ",
-                "delete_local": "🗑️ ",
-                "delete_remote": "🗑️ ",
-                "noop": "⏭️ "
-            }.get(item.action, "❓")
-            click.echo(f"  {icon} {item.action.upper()}: {item.path}")
-            click.echo(f"      Reason: {item.reason}")
+            prefix = PLAN_PREFIXES.get(item.action) or f"  ❓ {item.action.upper()}: "
+            lines.append(f"{prefix}{item.path}")
+            lines.append(f"      Reason: {item.reason}")
     
     if plan.conflicts:
-        click.echo("\n⚠️  Conflicts:")
+        lines.append("\n⚠️  Conflicts:")
         for conflict in plan.conflicts:
-            click.echo(f"  ⚔️  {conflict.path}")
-            click.echo(f"      {conflict.reason}")
+            lines.append(f"  ⚔️  {conflict.path}")
+            lines.append(f"      {conflict.reason}")
             
-    click.echo(f"\nTotal operations: {plan.total_operations}")
+    lines.append(f"\nTotal operations: {plan.total_operations}")
+    echo("\n".join(lines))
+
+def _compute_file_sets(local_files, remote_by_name):
+    """Split file names into (local only, remote only, on both sides) sets."""
+    local_names = local_files.keys()
+    remote_names = remote_by_name.keys()
+    return local_names - remote_names, remote_names - local_names, local_names & remote_names
+
 
 @click.command()
 @click.option("--conflict-strategy", 
@@ -36,14 +66,64 @@ def _print_plan(plan):
 @click.option("--no-push", is_flag=True, help="Skip pushing local changes (download only)")
 @click.option("--category", default=None, help="Specify the file category to sync")
 @click.option("--uberproject", is_flag=True, default=False, help="Include submodules in parent project sync")
+@click.option("--concurrency", "--max-concurrent", "concurrency", type=click.IntRange(min=1), default=None,
+              help="Number of transfers to run in parallel (default: max_download_workers setting)")
+@click.option("--batch-size", type=click.IntRange(min=1), default=None,
+              help="Number of uploads sent between rate-limit pauses (default: upload_batch_size setting)")
+@click.option("--recheck-conflicts", is_flag=True, default=False,
+              help="Compare every shared file for conflicts after syncing, not just those the plan flagged")
 @click.pass_obj
 @handle_errors
-def sync(config, conflict_strategy, dry_run, no_pull, no_push, category, uberproject):
+def sync(config, conflict_strategy, dry_run, no_pull, no_push, category, uberproject, concurrency, batch_size,
+         recheck_conflicts):
     """Synchronize local and remote files (bi-directional sync)."""
+    run_sync(
+        config,
+        conflict_strategy=conflict_strategy,
+        dry_run=dry_run,
+        no_pull=no_pull,
+        no_push=no_push,
+        category=category,
+        uberproject=uberproject,
+        concurrency=concurrency,
+        batch_size=batch_size,
+        recheck_conflicts=recheck_conflicts,
+    )
+
+
+def run_sync(
+    config,
+    conflict_strategy="prompt",
+    dry_run=False,
+    no_pull=False,
+    no_push=False,
+    category=None,
+    uberproject=False,
+    concurrency=None,
+    batch_size=None,
+    recheck_conflicts=False,
+    interactive=True,
+    quiet=False,
+):
+    """Programmatic entry point behind the ``sync`` command.
+
+    Lets callers sync a project in-process (for example with a config loaded via
+    ``FileConfigManager(project_path)``) instead of spawning ``csync sync``.
+    Configuration and provider errors propagate to the caller. With
+    ``interactive=False`` the prompt strategy never asks: conflicts raise
+    SyncConflictError before anything is transferred. ``quiet=True`` drops
+    the progress bar and everything this function would print, for callers
+    syncing several projects at once.
+    
+    Returns the results dict from ``SyncManager.execute_plan``, counting the
+    uploads of resolved conflicts too, or None if nothing was transferred
+    (a dry run, or everything was up to date).
+    """
+    echo = _silent if quiet else click.echo
+    
     # Determine sync direction
     if no_pull and no_push:
-        click.echo("Error: Cannot use both --no-pull and --no-push")
-        return
+        raise ConfigurationError("Cannot use both --no-pull and --no-push")
     
     direction = (
         SyncDirection.PUSH if no_pull and not no_push else
@@ -59,21 +139,34 @@ def sync(config, conflict_strategy, dry_run, no_pull, no_push, category, uberpro
     local_path = config.get_local_path()
     
     if not local_path:
-        click.echo("No .claudesync directory found. Run 'csync project create' first.")
-        return
+        raise ConfigurationError("No .claudesync directory found. Run 'csync project create' first.")
     
-    click.echo(f"Syncing project '{active_project_name}' ({direction.value})...")
+    echo(f"Syncing project '{active_project_name}' ({direction.value})...")
     if category:
-        click.echo(f"Using category: {category}")
+        echo(f"Using category: {category}")
     if uberproject:
-        click.echo("Including submodules in sync")
+        echo("Including submodules in sync")
     
-    # Get files
-    local_files = get_local_files(config, local_path, category=category, include_submodules=uberproject)
-    remote_files = provider.list_files(active_organization_id, active_project_id)
+    # Get files: the local walk and the remote listing are independent, so
+    # the walk runs while the listing request is in flight
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        local_future = executor.submit(
+            get_local_files_cached, config, local_path, category=category, include_submodules=uberproject
+        )
+        remote_future = executor.submit(
+            provider.list_files_cached,
+            active_organization_id,
+            active_project_id,
+            os.path.join(local_path, ".claudesync", "cache", "remote_manifest.json"),
+        )
+        local_files = local_future.result()
+        remote_files = remote_future.result()
+    remote_by_name = {f['file_name']: f for f in remote_files}
     
     # Initialize sync manager
-    sync_manager = SyncManager(provider, config, local_path)
+    sync_manager = SyncManager(
+        provider, config, local_path, max_workers=concurrency, upload_batch_size=batch_size
+    )
     
     # Build sync plan
     plan = sync_manager.build_plan(
@@ -81,98 +174,112 @@ def sync(config, conflict_strategy, dry_run, no_pull, no_push, category, uberpro
         dry_run=dry_run,
         conflict_strategy=conflict_strategy,
         local_files=local_files,
-        remote_files=remote_files
+        remote_files=remote_by_name
     )
     
     # Handle dry run
     if dry_run:
-        _print_plan(plan)
+        _print_plan(plan, echo)
         return
     
     # Handle conflicts with prompt strategy
     if plan.conflicts and conflict_strategy == 'prompt':
-        click.echo(f"\n⚠️  {len(plan.conflicts)} conflict(s) detected!")
-        _print_plan(plan)
+        if not interactive:
+            raise SyncConflictError(c.path for c in plan.conflicts)
+        echo(f"\n⚠️  {len(plan.conflicts)} conflict(s) detected!")
+        _print_plan(plan, echo)
         if not click.confirm("Continue sync anyway?"):
             raise click.Abort()
     
     # Execute plan
     if plan.total_operations > 0:
-        results = sync_manager.execute_plan(plan, direction=direction)
+        # Instructions are kept out of the plan; the legacy sync pass that
+        # used to follow it pulled them, so do that here
+        if not no_pull:
+            sync_manager._pull_project_instructions(remote_files)
+        
+        results = sync_manager.execute_plan(
+            plan, direction=direction, remote_files=remote_by_name, quiet=quiet
+        )
         
-        # Print results
-        click.echo("\n✅ Sync Complete:")
+        # Print results in one write, like _print_plan
+        lines = ["\n✅ Sync Complete:"]
         if results["uploaded"]:
-            click.echo(f"  ⬆️  Uploaded: {results['uploaded']} files")
+            lines.append(f"  ⬆️  Uploaded: {results['uploaded']} files")
         if results["downloaded"]:
-            click.echo(f"  ⬇️  Downloaded: {results['downloaded']} files")
+            lines.append(f"  ⬇️  Downloaded: {results['downloaded']} files")
         if results["deleted"]:
-            click.echo(f"  🗑️  Deleted: {results['deleted']} files")
+            lines.append(f"  🗑️  Deleted: {results['deleted']} files")
         
         if results["errors"]:
-            click.echo(f"\n❌ Errors ({len(results['errors'])}):")
-            for error in results["errors"][:5]:  # Show first 5 errors
-                click.echo(f"  - {error}")
+            lines.append(f"\n❌ Errors ({len(results['errors'])}):")
+            lines.extend(f"  - {error}" for error in results["errors"][:5])  # Show first 5 errors
+        echo("\n".join(lines))
     else:
-        click.echo("✅ Everything is up to date!")
+        echo("✅ Everything is up to date!")
         
-        # Show files to download
+        # An empty plan has no conflicts: any shared file whose hashes differ
+        # would have been planned as an upload, download or conflict
         if not no_pull:
-            files_to_download = []
-            for remote_file in remote_files:
-                if remote_file['file_name'] not in local_files:
-                    files_to_download.append(remote_file['file_name'])
+            _, remote_only, _ = _compute_file_sets(local_files, remote_by_name)
+            files_to_download = sorted(remote_only)
             if files_to_download:
-                click.echo("\nFiles to download:")
-                for f in files_to_download:
-                    click.echo(f"  [DOWNLOAD] {f}")
-        
-        # Show conflicts
-        resolver = ConflictResolver(config)
-        conflicts = resolver.detect_conflicts(local_files, remote_files)
-        if conflicts:
-            click.echo(f"\nConflicts detected ({len(conflicts)} files):")
-            for c in conflicts:
-                click.echo(f"  [CONFLICT] {c['file_name']}")
+                echo("\nFiles to download:\n" + "\n".join(f"  [DOWNLOAD] {f}" for f in files_to_download))
         
         return
     
-    # Handle conflicts
-    resolver = ConflictResolver(config)
-    conflicts = resolver.detect_conflicts(local_files, remote_files)
+    # Handle conflicts: the plan already compared every shared file, so only
+    # the files it flagged are read again unless a full recheck is requested.
+    # With no flagged conflicts the plan is authoritative and nothing is read.
+    conflicts = []
+    if recheck_conflicts or plan.conflicts:
+        resolver = ConflictResolver(config)
+        if recheck_conflicts:
+            _, _, shared = _compute_file_sets(local_files, remote_by_name)
+        else:
+            shared = {c.path for c in plan.conflicts if c.path in remote_by_name}
+        if shared:
+            conflicts = resolver.detect_conflicts(local_files, remote_by_name, shared=shared)
+    
+    # Plan conflicts the content check cleared differ only in line endings or
+    # surrounding whitespace, so the local version is pushed like any edit
+    reported = {conflict['file_name'] for conflict in conflicts}
+    to_upload = [c.path for c in plan.conflicts if c.path not in reported]
     
     if conflicts and not no_pull:
-        click.echo(f"\n⚠️  {len(conflicts)} conflict(s) detected!")
+        echo(f"\n⚠️  {len(conflicts)} conflict(s) detected!")
         
+        resolutions = []
+        resolved_names = []
         for conflict in conflicts:
             resolved = resolver.resolve_conflict(conflict, strategy=conflict_strategy)
             if resolved:
-                with open(conflict['local_path'], 'w', encoding='utf-8') as f:
-                    f.write(resolved)
-                click.echo(f"  ✓ Resolved: {conflict['file_name']}")
-    
-    # Create sync manager
-    sync_manager = SyncManager(provider, config, local_path)
-    
-    # Perform sync based on options
-    if no_pull:
-        # Push only (like old push command)
-        config.set("two_way_sync", False, local=True)
-        sync_manager.sync(local_files, remote_files)
-        click.echo("✓ Push complete")
-    elif no_push:
-        # Pull only
-        config.set("two_way_sync", True, local=True)
-        # Temporarily clear local files to force download
-        sync_manager.sync({}, remote_files)
-        click.echo("✓ Pull complete")
-    else:
-        # Full bi-directional sync
-        config.set("two_way_sync", True, local=True)
-        sync_manager.sync(local_files, remote_files)
-        click.echo("✓ Sync complete")
+                resolutions.append((conflict['local_path'], resolved))
+                resolved_names.append(conflict['file_name'])
+                # Keeping the remote version is done once it is written
+                # locally; anything else has to be pushed or the same
+                # conflict comes back on the next sync
+                if resolved != conflict['remote_content']:
+                    to_upload.append(conflict['file_name'])
+        
+        resolver.write_resolutions(resolutions)
+        if resolved_names:
+            echo("\n".join(f"  ✓ Resolved: {name}" for name in resolved_names))
     
-    click.echo(f"Project URL: https://claude.ai/project/{active_project_id}")
+    if to_upload and not no_push:
+        upload_plan = SyncPlan(
+            actions=[PlanItem(action="upload", path=name, reason="Conflict resolved") for name in to_upload],
+            conflicts=[],
+        )
+        upload_results = sync_manager.execute_plan(upload_plan, direction=direction, quiet=quiet)
+        echo(f"  ⬆️  Uploaded: {upload_results['uploaded']} resolved files")
+        for error in upload_results["errors"][:5]:
+            echo(f"  - {error}")
+        results["uploaded"] += upload_results["uploaded"]
+        results["errors"].extend(upload_results["errors"])
+    
+    echo(f"Project URL: https://claude.ai/project/{active_project_id}")
+    return results
 
 # Keep the existing schedule command
 @click.command()
@@ -183,70 +290,69 @@ def sync(config, conflict_strategy, dry_run, no_pull, no_push, category, uberpro
 @handle_errors
 def schedule(config, interval):
     """Set up automated synchronization using system scheduler."""
-    import platform
-    import os
-    import subprocess
-    
     system = platform.system()
     
+    if system not in ("Windows", "Linux", "Darwin"):
+        click.echo(f"Automated scheduling not supported on {system}")
+        return
+    
+    local_path = config.get_local_path()
+    if not local_path:
+        click.echo("No .claudesync directory found. Run 'csync project create' first.")
+        return
+    project_dir = os.path.realpath(local_path)
+    
+    csync_path = shutil.which("csync")
+    if not csync_path:
+        click.echo("Error: csync command not found in PATH")
+        return
+    
     if system == "Windows":
         # Windows Task Scheduler
         task_name = "ClaudeSync_AutoSync"
-        csync_path = shutil.which("csync")
-        
-        if not csync_path:
-            click.echo("Error: csync command not found in PATH")
-            return
         
-        # Create scheduled task
-        cmd = f'schtasks /create /tn "{task_name}" /tr "{csync_path} sync" /sc minute /mo {interval} /f'
+        # Create scheduled task; passing arguments as a list quotes a
+        # csync path containing spaces correctly without going through a shell
+        cmd = [
+            "schtasks", "/create", "/tn", task_name, "/tr", f'"{csync_path}" sync',
+            "/sc", "minute", "/mo", str(interval), "/f",
+        ]
         
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            subprocess.run(cmd, check=True)
             click.echo(f"✓ Scheduled sync every {interval} minutes on Windows")
             click.echo(f"  Task name: {task_name}")
             click.echo(f"  To remove: schtasks /delete /tn \"{task_name}\" /f")
         except subprocess.CalledProcessError:
             click.echo("Error creating scheduled task")
     
-    elif system == "Linux" or system == "Darwin":
+    else:
         # Unix-like systems (cron)
-        import tempfile
-        
-        # Get current crontab
-        try:
-            current_cron = subprocess.check_output(['crontab', '-l'], text=True)
-        except subprocess.CalledProcessError:
-            current_cron = ""
-        
-        # Add new cron job
-        csync_path = shutil.which("csync")
-        if not csync_path:
-            click.echo("Error: csync command not found in PATH")
-            return
+        # Quote paths so a space in either does not break the cron line
+        job_marker = f"cd {shlex.quote(project_dir)} && "
+        new_job = f"*/{interval} * * * * {job_marker}{shlex.quote(csync_path)} sync"
         
-        new_job = f"*/{interval} * * * * cd {os.getcwd()} && {csync_path} sync\n"
+        # Get current crontab; 'crontab -l' fails when the user has none yet
+        current = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
+        lines = current.stdout.splitlines() if current.returncode == 0 else []
         
         # Check if job already exists
-        if new_job.strip() in current_cron:
+        if new_job in lines:
             click.echo("Sync schedule already exists")
             return
         
-        # Write new crontab
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write(current_cron)
-            f.write(new_job)
-            temp_file = f.name
+        # Replace any earlier schedule for this project, keep everything else
+        lines = [
+            line for line in lines
+            if not (job_marker in line and line.rstrip().endswith(" sync"))
+        ]
+        lines.append(new_job)
         
+        # Write new crontab in one go through stdin
         try:
-            subprocess.run(['crontab', temp_file], check=True)
-            os.unlink(temp_file)
+            subprocess.run(['crontab', '-'], input='\n'.join(lines) + '\n', text=True, check=True)
             click.echo(f"✓ Scheduled sync every {interval} minutes using cron")
             click.echo(f"  To view: crontab -l")
             click.echo(f"  To remove: crontab -e (and delete the ClaudeSync line)")
         except subprocess.CalledProcessError:
             click.echo("Error setting up cron job")
-            os.unlink(temp_file)
-    
-    else:
-        click.echo(f"Automated scheduling not supported on {system}")
@@ -1,9 +1,31 @@
 import click
-import subprocess
+import mmap
 import time
 import os
+from ..exceptions import ConfigurationError, ProviderError
 from ..utils import handle_errors
-from ..file_watcher import FileWatcherService
+from ..file_watcher import FileWatcherService, push_changes, request_sync
+
+def _tail_lines(path, n=10):
+    """Return the last ``n`` lines of a file, scanning backwards from the end.
+
+    The file is memory-mapped and newlines are located with ``rfind``, so only
+    the pages holding those lines are touched and nothing else is copied.
+    """
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            # A trailing newline ends the last line rather than starting another
+            start = end - 1 if mm[end - 1:end] == b'\n' else end
+            for _ in range(n):
+                start = mm.rfind(b'\n', 0, start)
+                if start < 0:
+                    break
+            tail = mm[start + 1:end]
+    return [line.decode('utf-8', 'replace') for line in tail.splitlines()]
 
 @click.group()
 def watch():
@@ -13,9 +35,11 @@ def watch():
 @watch.command()
 @click.option('--daemon', '-d', is_flag=True, help='Run as background daemon')
 @click.option('--startup-sync', is_flag=True, help='Perform initial sync on startup')
+@click.option('--debounce-ms', type=click.IntRange(min=0), default=500,
+              help='Quiet period after the last change before syncing')
 @click.pass_obj
 @handle_errors
-def start(config, daemon, startup_sync):
+def start(config, daemon, startup_sync, debounce_ms):
     """Start watching for file changes."""
     local_path = config.get('local_path')
     if not local_path:
@@ -25,13 +49,17 @@ def start(config, daemon, startup_sync):
     # Perform startup sync if requested
     if startup_sync:
         click.echo("Performing initial sync...")
-        result = subprocess.run(['csync', 'push'], cwd=local_path)
-        if result.returncode != 0:
-            click.echo("Initial sync failed. Aborting.")
+        try:
+            push_changes(config)
+        except (ConfigurationError, ProviderError) as e:
+            click.echo(f"Initial sync failed: {e}. Aborting.")
+            return
+        except KeyboardInterrupt:
+            click.echo("Initial sync interrupted. Aborting.")
             return
     
     # Create watcher service
-    watcher = FileWatcherService(config)
+    watcher = FileWatcherService(config, debounce_delay=debounce_ms / 1000)
     
     if daemon:
         click.echo(f"Starting file watcher daemon for: {local_path}")
@@ -75,18 +103,14 @@ def status(config):
     elif status['status'] == 'running':
         click.echo(f"File watcher daemon is running (PID: {status['pid']})")
         
-        # Check log file
+        # Show last few lines of log, if there is one
         log_file = os.path.join(local_path, '.claudesync', 'watch.log')
-        if os.path.exists(log_file):
-            # Show last few lines of log
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                recent = lines[-10:] if len(lines) > 10 else lines
-                
-                if recent:
-                    click.echo("\nRecent activity:")
-                    for line in recent:
-                        click.echo(f"  {line.strip()}")
+        try:
+            recent = _tail_lines(log_file, 10)
+        except FileNotFoundError:
+            recent = []
+        if recent:
+            click.echo("\nRecent activity:\n" + "\n".join(f"  {line.strip()}" for line in recent))
     else:
         click.echo(f"Stale PID file found (PID: {status['pid']})")
         click.echo("Run 'claudesync watch stop' to clean up.")
@@ -102,9 +126,23 @@ def sync_now(config):
         return
     
     click.echo("Triggering sync...")
-    result = subprocess.run(['csync', 'push'], cwd=local_path)
     
-    if result.returncode == 0:
-        click.echo("Sync completed successfully.")
-    else:
-        click.echo("Sync failed. Check the logs for details.")
\ No newline at end of file
+    # A running watcher syncs on request, sparing this process the work
+    handled = request_sync(local_path)
+    if handled is not None:
+        if handled:
+            click.echo("Sync completed by the running watcher.")
+        else:
+            click.echo("Sync failed in the running watcher. See .claudesync/watch.log for details.")
+        return
+    
+    try:
+        push_changes(config)
+    except (ConfigurationError, ProviderError) as e:
+        click.echo(f"Sync failed: {e}")
+        return
+    except KeyboardInterrupt:
+        click.echo("Sync interrupted.")
+        return
+    
+    click.echo("Sync completed successfully.")
\ No newline at end of file
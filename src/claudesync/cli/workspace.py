@@ -1,7 +1,10 @@
 import click
+import fnmatch
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from ..workspace_config import WorkspaceConfig
 from ..workspace_manager import WorkspaceManager
@@ -20,6 +23,59 @@ if sys.platform == "win32":
     # Set environment variable for child processes
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+# Projects listed by 'workspace set-root' before pointing to 'workspace discover'
+SET_ROOT_PREVIEW = 5
+
+# Replaces characters that are invalid in file names when naming project directories
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+# How _name_matcher reads --filter/--exclude values, for the option help
+_FILTER_SYNTAX = ("comma-separated terms; a term containing *, ? or [ is a glob that must "
+                  "match the whole name, any other term matches as a substring")
+
+
+def _name_matcher(pattern: str):
+    """Compile a --filter/--exclude value into one case-insensitive search function.
+
+    The value is split on commas into terms. A term containing ``*``, ``?``
+    or ``[`` is a glob that must match the whole name, so a filter such as
+    ``[WIP]`` is a character class rather than a substring; any other term
+    matches as a substring. Returns None if there are no terms, meaning no
+    filtering.
+    """
+    alternatives = []
+    for term in pattern.split(','):
+        term = term.strip()
+        if not term:
+            continue
+        if any(c in term for c in '*?['):
+            alternatives.append(r'\A' + fnmatch.translate(term))
+        else:
+            alternatives.append(re.escape(term))
+    if not alternatives:
+        return None
+    return re.compile('|'.join(alternatives), re.IGNORECASE).search
+
+
+def _get_workspace_manager() -> WorkspaceManager:
+    """Return the workspace manager shared by the current invocation.
+
+    Like the provider cache in validate_and_get_provider, the manager is kept
+    on the Click context, so the workspace config is read once and discovery
+    results are reused by everything the command runs.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return WorkspaceManager(WorkspaceConfig())
+    
+    manager = ctx.meta.get("claudesync.workspace_manager")
+    if manager is None:
+        manager = WorkspaceManager(WorkspaceConfig())
+        ctx.meta["claudesync.workspace_manager"] = manager
+    return manager
+
+
 @click.group()
 def workspace():
     """Manage workspace with multiple ClaudeSync projects."""
@@ -31,18 +87,26 @@ def workspace():
 @handle_errors
 def set_root(config, path):
     """Set the workspace root directory."""
-    ws_config = WorkspaceConfig()
+    manager = _get_workspace_manager()
+    ws_config = manager.config
     ws_config.set_workspace_root(path)
+    manager.invalidate_discovery()
     click.echo(f"Workspace root set to: {os.path.abspath(path)}")
     
-    # Discover projects
-    manager = WorkspaceManager(ws_config)
-    projects = manager.discover_projects()
+    # Preview a few projects with a shallow walk that stops early; the full
+    # list is what 'workspace discover' is for
+    max_depth = min(2, ws_config.config.get("max_search_depth", 3))
+    projects = manager.discover_projects(max_depth=max_depth, limit=SET_ROOT_PREVIEW + 1)
     
     if projects:
-        click.echo(f"\nFound {len(projects)} project(s):")
-        for project in projects:
-            click.echo(f"  - {project['name']} at {project['relative_path']}")
+        lines = [f"  - {project['name']} at {project['relative_path']}"
+                 for project in projects[:SET_ROOT_PREVIEW]]
+        if len(projects) > SET_ROOT_PREVIEW:
+            header = f"Found more than {SET_ROOT_PREVIEW} projects:"
+            lines.append("  ... run 'csync workspace discover' to list all")
+        else:
+            header = f"Found {len(projects)} project(s):"
+        click.echo(f"\n{header}\n" + "\n".join(lines))
     else:
         click.echo("\nNo ClaudeSync projects found in workspace.")
 
@@ -51,11 +115,14 @@ def set_root(config, path):
 @handle_errors
 def config(config):
     """Show workspace configuration."""
-    ws_config = WorkspaceConfig()
+    ws_config = _get_workspace_manager().config
     config_data = ws_config.get_config()
     
     click.echo("Workspace Configuration:")
-    click.echo(json.dumps(config_data, indent=2, ensure_ascii=False))
+    # Stream the JSON straight to stdout rather than building the whole string first
+    stdout = click.get_text_stream('stdout')
+    json.dump(config_data, stdout, indent=2, ensure_ascii=False)
+    stdout.write("\n")
 
 @workspace.command()
 @click.pass_obj
@@ -63,21 +130,22 @@ def config(config):
 def reset(config):
     """Reset workspace configuration to defaults."""
     if click.confirm("This will reset all workspace settings. Continue?"):
-        ws_config = WorkspaceConfig()
-        ws_config.reset()
+        manager = _get_workspace_manager()
+        manager.config.reset()
+        manager.invalidate_discovery()
         click.echo("Workspace configuration reset to defaults.")
 
 @workspace.command()
 @click.option('--json', 'output_json', is_flag=True, help='Output in JSON format')
 @click.option('--show-remote', is_flag=True, help='Also show remote projects not cloned locally')
+@click.option('--refresh', is_flag=True, help='Walk the workspace again instead of reusing recently discovered projects')
 @click.pass_obj
 @handle_errors
-def discover(config, output_json, show_remote):
+def discover(config, output_json, show_remote, refresh):
     """Discover all ClaudeSync projects in workspace."""
-    ws_config = WorkspaceConfig()
-    manager = WorkspaceManager(ws_config)
+    manager = _get_workspace_manager()
     
-    projects = manager.discover_projects()
+    projects = manager.discover_projects(use_cache=not refresh)
     remote_not_local = []
     
     # Check for remote projects if requested
@@ -98,7 +166,10 @@ def discover(config, output_json, show_remote):
             'local': projects,
             'remote_only': [{'name': p['name'], 'id': p['id']} for p in remote_not_local] if show_remote else []
         }
-        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
+        # Streamed like 'workspace config', without building the whole string
+        stdout = click.get_text_stream('stdout')
+        json.dump(output, stdout, indent=2, ensure_ascii=False)
+        stdout.write("\n")
 
 # Consolidated clone command from workspace_clone.py and clone.py
 @workspace.command()
@@ -113,7 +184,7 @@ def clone(config, dry_run, include_archived, skip_existing, clean):
     provider = validate_and_get_provider(config)
     
     # Get workspace root
-    ws_config = WorkspaceConfig()
+    ws_config = _get_workspace_manager().config
     workspace_root = ws_config.get_workspace_root()
     
     if not workspace_root:
@@ -170,9 +241,7 @@ def clone(config, dry_run, include_archived, skip_existing, clean):
         is_archived = project.get('archived_at') is not None
         
         # Sanitize project name for filesystem (keep emojis)
-        invalid_chars = '<>:"/\\|?*'
-        safe_name = "".join(c if c not in invalid_chars else '_' 
-                           for c in project_name).strip()
+        safe_name = project_name.translate(_SANITIZE_TABLE).strip()
         safe_name = safe_name.rstrip('. ')
         project_path = os.path.join(workspace_root, safe_name)
         
@@ -315,15 +384,19 @@ def list_remote(config, format, include_archived):
               type=click.Choice(['prompt', 'local-wins', 'remote-wins']), 
               default='prompt',
               help='How to handle conflicts')
-@click.option('--filter', 'project_filter', help='Only sync projects matching pattern')
-@click.option('--exclude', 'project_exclude', help='Skip projects matching pattern')
+@click.option('--filter', 'project_filter',
+              help=f'Only sync projects matching pattern ({_FILTER_SYNTAX})')
+@click.option('--exclude', 'project_exclude',
+              help=f'Skip projects matching pattern ({_FILTER_SYNTAX})')
 @click.option('--parallel-workers', type=int, default=4, help='Number of parallel workers')
 @click.option('--local-only', is_flag=True, help='Skip checking for new remote projects')
+@click.option('--isolate', is_flag=True, help='Run each project sync in its own csync process (for debugging)')
+@click.option('--refresh', is_flag=True, help='Walk the workspace again instead of reusing recently discovered projects')
 @click.pass_obj
 @handle_errors
 def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one_way, push_only, 
              pull_only, no_instructions, watch_after, conflict_strategy,
-             project_filter, project_exclude, parallel_workers, local_only):
+             project_filter, project_exclude, parallel_workers, local_only, isolate, refresh):
     """Sync all projects in workspace (TRUE bidirectional sync by default).
     
     By default, performs true bidirectional sync:
@@ -344,8 +417,8 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
     if one_way and (push_only or pull_only):
         raise click.BadParameter("Cannot use --one-way with --push-only or --pull-only")
     
-    ws_config = WorkspaceConfig()
-    manager = WorkspaceManager(ws_config)
+    manager = _get_workspace_manager()
+    ws_config = manager.config
     
     # Check for new remote projects first (unless local-only)
     if not local_only and not push_only:
@@ -355,7 +428,7 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
         if organization_id:
             try:
                 remote_projects = provider.get_projects(organization_id, include_archived=False)
-                local_projects = manager.discover_projects()
+                local_projects = manager.discover_projects(use_cache=not refresh)
                 local_project_ids = {p['id'] for p in local_projects if p.get('id')}
                 
                 new_remote_projects = [p for p in remote_projects if p['id'] not in local_project_ids]
@@ -381,8 +454,7 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
                             project_id = project['id']
                             
                             # Sanitize project name for filesystem
-                            invalid_chars = '<>:"/\\|?*'
-                            safe_name = "".join(c if c not in invalid_chars else '_' for c in project_name).strip()
+                            safe_name = project_name.translate(_SANITIZE_TABLE).strip()
                             project_path = os.path.join(workspace_root, safe_name)
                             
                             if not os.path.exists(project_path):
@@ -431,13 +503,15 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
             except Exception as e:
                 click.echo(f"Warning: Could not check for remote projects: {str(e)}")
     
-    projects = manager.discover_projects()
+    projects = manager.discover_projects(use_cache=not refresh)
     
     # Apply filters
-    if project_filter:
-        projects = [p for p in projects if project_filter.lower() in p['name'].lower()]
-    if project_exclude:
-        projects = [p for p in projects if project_exclude.lower() not in p['name'].lower()]
+    matches = _name_matcher(project_filter) if project_filter else None
+    if matches:
+        projects = [p for p in projects if matches(p['name'])]
+    excluded = _name_matcher(project_exclude) if project_exclude else None
+    if excluded:
+        projects = [p for p in projects if not excluded(p['name'])]
     
     if not projects:
         click.echo("No projects found to sync.")
@@ -452,7 +526,8 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
         'pull_only': pull_only,
         'with_instructions': not no_instructions,  # Inverted - default is True
         'conflict_strategy': conflict_strategy,
-        'parallel_workers': parallel_workers if not sequential else 1
+        'parallel_workers': parallel_workers if not sequential else 1,
+        'isolate': isolate
     }
     
     click.echo(f"Found {len(projects)} project(s) to sync.")
@@ -533,34 +608,38 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
     if not click.confirm("\nContinue with sync?"):
         return
     
-    # Perform sync
-    results = manager.sync_all_projects(
-        projects,
-        sync_options=sync_options,
-        parallel=not sequential,
-        dry_run=False
-    )
+    succeeded = set()
+    failed_count = 0
     
-    # Show results
-    click.echo("\nSync Results:")
-    
-    success_count = sum(1 for r in results if r['status'] == 'success')
-    failed_count = sum(1 for r in results if r['status'] in ['failed', 'error', 'timeout'])
-    
-    for result in results:
+    def show_result(result):
+        nonlocal failed_count
+        # Results are tallied as they stream in, so no second pass is needed
         if result['status'] == 'success':
+            succeeded.add(result['project'])
             details = result.get('details', '')
             click.echo(f"  ✓ {result['project']} ({result['duration']:.1f}s) {details}")
         else:
+            if result['status'] in ('failed', 'error', 'timeout', 'conflict'):
+                failed_count += 1
             click.echo(f"  ✗ {result['project']}: {result['message']}")
     
-    click.echo(f"\nSummary: {success_count} succeeded, {failed_count} failed")
+    # Perform sync, showing each project's result as soon as it finishes
+    click.echo("\nSync Results:")
+    manager.sync_all_projects(
+        projects,
+        sync_options=sync_options,
+        parallel=not sequential,
+        dry_run=False,
+        on_result=show_result
+    )
+    
+    click.echo(f"\nSummary: {len(succeeded)} succeeded, {failed_count} failed")
     
     # Start watchers if requested
-    if watch_after and success_count > 0:
+    if watch_after and succeeded:
         click.echo("\nStarting file watchers...")
         watch_results = manager.start_watchers(
-            [p for p in projects if any(r['project'] == p['name'] and r['status'] == 'success' for r in results)]
+            [p for p in projects if p['name'] in succeeded]
         )
         watch_success = sum(1 for r in watch_results if r['status'] == 'started')
         click.echo(f"Started {watch_success} watcher(s)")
@@ -570,14 +649,14 @@ def sync_all(config, sequential, dry_run, verbose, no_prune, no_prune_local, one
 @click.option('--backup-existing', is_flag=True, help='Backup existing chat files')
 @click.option('--skip-errors', is_flag=True, help='Continue even if some projects fail')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed progress')
+@click.option('--refresh', is_flag=True, help='Walk the workspace again instead of reusing recently discovered projects')
 @click.pass_obj
 @handle_errors
-def chat_pull_all(config, dry_run, backup_existing, skip_errors, verbose):
+def chat_pull_all(config, dry_run, backup_existing, skip_errors, verbose, refresh):
     """Pull chats for all projects in workspace."""
-    ws_config = WorkspaceConfig()
-    manager = WorkspaceManager(ws_config)
+    manager = _get_workspace_manager()
     
-    projects = manager.discover_projects()
+    projects = manager.discover_projects(use_cache=not refresh)
     
     if not projects:
         click.echo("No projects found.")
@@ -604,25 +683,32 @@ def chat_pull_all(config, dry_run, backup_existing, skip_errors, verbose):
     click.echo("Chat Pull Summary:")
     click.echo("="*60)
     
-    success_count = sum(1 for r in results if r['status'] == 'success')
-    failed_count = sum(1 for r in results if r['status'] in ['failed', 'error'])
+    # Count and format in one pass over the results
+    success_count = failed_count = 0
+    lines = []
+    for result in results:
+        if result['status'] == 'success':
+            success_count += 1
+            lines.append(f"  ✓ {result['project']}")
+        else:
+            if result['status'] in ('failed', 'error'):
+                failed_count += 1
+            lines.append(f"  ✗ {result['project']}: {result['message'][:100]}")
     
-    if verbose or failed_count > 0:
-        for result in results:
-            if result['status'] == 'success':
-                click.echo(f"  ✓ {result['project']}")
-            else:
-                click.echo(f"  ✗ {result['project']}: {result['message'][:100]}")
+    if lines and (verbose or failed_count > 0):
+        click.echo("\n".join(lines))
     
     click.echo(f"\nTotal: {success_count} succeeded, {failed_count} failed out of {len(projects)} projects")
+    
+    if failed_count and not skip_errors:
+        raise click.Abort()
 
 @workspace.command()
 @click.pass_obj
 @handle_errors
 def status(config):
     """Show workspace status overview."""
-    ws_config = WorkspaceConfig()
-    manager = WorkspaceManager(ws_config)
+    manager = _get_workspace_manager()
     
     status = manager.get_status()
     
@@ -639,10 +725,38 @@ def status(config):
             click.echo(f"     Path: {project['path']}")
             click.echo(f"     Watcher: {project['watcher']}")
 
+def _list_entries(path: str) -> dict:
+    """Map the names in directory ``path`` to their os.DirEntry; empty if it can't be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def _clone_one(project: dict, project_path: str, organization_id: str):
+    """Create ``project_path`` with a .claudesync config pointing at ``project``."""
+    # Create the project directory and its .claudesync config directory
+    claudesync_dir = os.path.join(project_path, '.claudesync')
+    os.makedirs(claudesync_dir, exist_ok=True)
+    
+    # Create local config
+    local_config = {
+        "active_provider": "claude.ai",
+        "local_path": project_path,
+        "active_organization_id": organization_id,
+        "active_project_id": project['id'],
+        "active_project_name": project['name']
+    }
+    
+    config_file = os.path.join(claudesync_dir, 'config.local.json')
+    with open(config_file, 'w') as f:
+        json.dump(local_config, f, indent=2)
+
 @workspace.command()
 @click.option('--output-dir', help='Output directory for cloned projects')
 @click.option('--include-archived', is_flag=True, help='Include archived projects')
-@click.option('--filter', 'name_filter', help='Only clone projects matching pattern')
+@click.option('--filter', 'name_filter',
+              help=f'Only clone projects matching pattern ({_FILTER_SYNTAX})')
 @click.option('--skip-existing', is_flag=True, help='Skip projects that already exist locally')
 @click.option('--dry-run', is_flag=True, help='Show what would be cloned without doing it')
 @click.pass_obj
@@ -663,7 +777,9 @@ def clone(config, output_dir, include_archived, name_filter, skip_existing, dry_
     # Apply filter if specified
     if name_filter:
         original_count = len(projects)
-        projects = [p for p in projects if name_filter.lower() in p['name'].lower()]
+        matches = _name_matcher(name_filter)
+        if matches:
+            projects = [p for p in projects if matches(p['name'])]
         click.echo(f"Filtered {original_count} projects to {len(projects)} matching '{name_filter}'")
     
     if not projects:
@@ -672,7 +788,7 @@ def clone(config, output_dir, include_archived, name_filter, skip_existing, dry_
     
     # Determine output directory
     if not output_dir:
-        ws_config = WorkspaceConfig()
+        ws_config = _get_workspace_manager().config
         output_dir = ws_config.get_workspace_root()
         if not output_dir:
             output_dir = os.getcwd()
@@ -685,69 +801,83 @@ def clone(config, output_dir, include_archived, name_filter, skip_existing, dry_
     else:
         click.echo(f"\nFound {len(projects)} project(s) to clone.")
     
-    # Process each project
+    # Process each project: decide what to clone here, then write the
+    # project configs concurrently below
     cloned = 0
     skipped = 0
     failed = 0
+    to_clone = []
+    claimed = set()
+    
+    # One listing of the output directory answers the existence checks
+    existing = _list_entries(output_dir)
+    folded = {name.casefold() for name in existing}
     
     for project in projects:
         project_name = project['name']
-        project_id = project['id']
         is_archived = bool(project.get('archived_at'))
         
         # Sanitize project name for filesystem (keep emojis)
-        invalid_chars = '<>:"/\\|?*'
-        safe_name = "".join(c if c not in invalid_chars else '_' for c in project_name).strip()
+        safe_name = project_name.translate(_SANITIZE_TABLE).strip()
         
         project_path = os.path.join(output_dir, safe_name)
         
-        # Check if already exists
-        if os.path.exists(project_path):
+        # An earlier project in this run already takes this directory
+        if project_path in claimed:
+            click.echo(f"  ⏭️  Skipping (already configured): {project_name}")
+            skipped += 1
+            continue
+        
+        # Check if already exists. A name that only differs in case may
+        # still be the same directory on case-insensitive file systems, and
+        # names like '' or '..' aren't entries at all, so ask the OS then.
+        if safe_name in existing:
+            exists = True
+        elif safe_name.casefold() in folded or safe_name in ('', '.', '..'):
+            exists = os.path.exists(project_path)
+        else:
+            exists = False
+        
+        if exists:
             if skip_existing:
                 click.echo(f"  ⏭️  Skipping (exists): {project_name}")
                 skipped += 1
                 continue
             else:
-                # Check if it's already a ClaudeSync project
+                # Check if it's already a ClaudeSync project; only a
+                # directory can hold one
+                entry = existing.get(safe_name)
                 config_file = os.path.join(project_path, '.claudesync', 'config.local.json')
-                if os.path.exists(config_file):
+                if (entry is None or entry.is_dir()) and os.path.exists(config_file):
                     click.echo(f"  ⏭️  Skipping (already configured): {project_name}")
                     skipped += 1
                     continue
         
+        claimed.add(project_path)
         if dry_run:
             status_icon = "🗄️" if is_archived else "📁"
             click.echo(f"  {status_icon} Would clone: {project_name} -> {project_path}")
             cloned += 1
         else:
-            try:
-                # Create directory
-                os.makedirs(project_path, exist_ok=True)
-                
-                # Create .claudesync config directory
-                claudesync_dir = os.path.join(project_path, '.claudesync')
-                os.makedirs(claudesync_dir, exist_ok=True)
-                
-                # Create local config
-                local_config = {
-                    "active_provider": "claude.ai",
-                    "local_path": project_path,
-                    "active_organization_id": organization_id,
-                    "active_project_id": project_id,
-                    "active_project_name": project_name
-                }
-                
-                config_file = os.path.join(claudesync_dir, 'config.local.json')
-                with open(config_file, 'w') as f:
-                    json.dump(local_config, f, indent=2)
-                
-                status_icon = "🗄️" if is_archived else "✓"
-                click.echo(f"  {status_icon} Cloned: {project_name}")
-                cloned += 1
-                
-            except Exception as e:
-                click.echo(f"  ✗ Failed to clone {project_name}: {str(e)}")
-                failed += 1
+            to_clone.append((project, project_path))
+    
+    if to_clone:
+        with ThreadPoolExecutor(max_workers=min(32, len(to_clone))) as executor:
+            future_to_project = {
+                executor.submit(_clone_one, project, project_path, organization_id): project
+                for project, project_path in to_clone
+            }
+            # Results are echoed from this thread only, as each clone finishes
+            for future in as_completed(future_to_project):
+                project = future_to_project[future]
+                try:
+                    future.result()
+                    status_icon = "🗄️" if project.get('archived_at') else "✓"
+                    click.echo(f"  {status_icon} Cloned: {project['name']}")
+                    cloned += 1
+                except Exception as e:
+                    click.echo(f"  ✗ Failed to clone {project['name']}: {str(e)}")
+                    failed += 1
     
     # Summary
     click.echo(f"\n{'DRY RUN ' if dry_run else ''}Summary:")
@@ -817,8 +947,7 @@ def watchers(config, stop, start):
         click.echo("Please specify --start or --stop")
         return
         
-    ws_config = WorkspaceConfig()
-    manager = WorkspaceManager(ws_config)
+    manager = _get_workspace_manager()
     
     projects = manager.discover_projects()
     
@@ -847,7 +976,7 @@ def migrate(config, remove_old, dry_run):
     """Migrate from individual .claudesync directories to global workspace config."""
     from claudesync.global_workspace_config import GlobalWorkspaceConfig
     
-    ws_config = WorkspaceConfig()
+    ws_config = _get_workspace_manager().config
     workspace_root = ws_config.get_workspace_root() or os.getcwd()
     
     # Initialize global config
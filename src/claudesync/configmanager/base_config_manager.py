@@ -40,6 +40,8 @@ class BaseConfigManager(ABC):
             "prune_remote_files": False,
             "claude_api_url": "https://claude.ai/api",
             "compression_algorithm": "none",
+            # Directory names never descended into, on top of VCS metadata
+            "exclude_dirs": ["node_modules", "__pycache__", ".venv", "venv"],
             "submodule_detect_filenames": [
                 "pom.xml",
                 "build.gradle",
@@ -19,18 +19,26 @@ class FileConfigManager(BaseConfigManager):
     in provider-specific files.
     """
 
-    def __init__(self):
+    def __init__(self, project_path=None):
         """
         Initialize the ConfigManager.
 
         Sets up paths for global and local configuration files and loads both configurations.
+
+        Args:
+            project_path (str, optional): Directory to start the local configuration search
+                from. Defaults to the current working directory, which lets callers load a
+                project's configuration without changing directory.
         """
         super().__init__()
+        self.project_path = Path(os.path.abspath(project_path)) if project_path else None
         self.global_config_dir = Path.home() / ".claudesync"
         self.global_config_file = self.global_config_dir / "config.json"
         self.global_config = self._load_global_config()
         self.local_config = {}
         self.local_config_dir = None
+        self._local_config_dirty = False
+        self._created_config_dir = None
         self._load_local_config()
         
         # Initialize dynamic config wrapper
@@ -62,13 +70,14 @@ class FileConfigManager(BaseConfigManager):
         """
         Finds the nearest directory containing a .claudesync folder.
 
-        Searches from the current working directory upwards until it finds a .claudesync folder
-        or reaches the root directory. Excludes the ~/.claudesync directory.
+        Searches from the project path (or the current working directory) upwards until it
+        finds a .claudesync folder or reaches the root directory. Excludes the ~/.claudesync
+        directory.
 
         Returns:
             Path: The path containing the .claudesync folder, or None if not found.
         """
-        current_dir = Path.cwd()
+        current_dir = self.project_path or Path.cwd()
         root_dir = Path(current_dir.root)
         home_dir = Path.home()
         depth = 0
@@ -111,6 +120,7 @@ class FileConfigManager(BaseConfigManager):
                             needs_save = True
 
                     if needs_save:
+                        self._local_config_dirty = True
                         self._save_local_config()
 
     def get_local_path(self):
@@ -157,23 +167,41 @@ class FileConfigManager(BaseConfigManager):
                 if candidate_dir.name == ".claudesync":
                     candidate_dir = candidate_dir.parent
 
+        if candidate_dir != self.local_config_dir:
+            # A different target directory needs its own copy of the config
+            self._local_config_dirty = True
         self.local_config_dir = candidate_dir
         if self.local_config_dir:
-            config_dir = self.local_config_dir / ".claudesync"
-            config_dir.mkdir(parents=True, exist_ok=True)
+            self._create_config_dir(self.local_config_dir / ".claudesync")
         return self.local_config_dir
 
+    def _create_config_dir(self, config_dir):
+        """Create the .claudesync directory, skipping the syscall if already done."""
+        if config_dir != self._created_config_dir:
+            config_dir.mkdir(parents=True, exist_ok=True)
+            self._created_config_dir = config_dir
+
     def set(self, key, value, local=False):
         """
         Sets a configuration value and saves the configuration.
 
+        Local values are only written to disk when they actually change, so
+        re-setting a key to its current value does not rewrite config.local.json.
+
         Args:
             key (str): The key for the configuration setting to set.
             value (any): The value to set for the given key.
             local (bool): If True, sets the value in the local configuration. Otherwise, sets it in the global configuration.
         """
         if local:
-            self.local_config[key] = value
+            # Containers may have been mutated in place, so always treat them as changed
+            if (
+                key not in self.local_config
+                or self.local_config[key] != value
+                or isinstance(value, (dict, list))
+            ):
+                self.local_config[key] = value
+                self._local_config_dirty = True
             self._ensure_local_config_directory(key, value)
             self._save_local_config()
         else:
@@ -193,14 +221,20 @@ class FileConfigManager(BaseConfigManager):
     def _save_local_config(self):
         """
         Saves the current local configuration to the .claudesync/config.local.json file.
+
+        Skips the write when nothing has changed since the last load or save and the
+        file already exists.
         """
         if self.local_config_dir:
             local_config_file = (
                 self.local_config_dir / ".claudesync" / "config.local.json"
             )
-            local_config_file.parent.mkdir(parents=True, exist_ok=True)
+            if not self._local_config_dirty and local_config_file.exists():
+                return
+            self._create_config_dir(local_config_file.parent)
             with open(local_config_file, "w", encoding="utf-8") as f:
                 json.dump(self.local_config, f, indent=2, ensure_ascii=False)
+            self._local_config_dirty = False
 
     def set_session_key(self, provider, session_key, expiry):
         """
@@ -2,10 +2,14 @@ import os
 import difflib
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 import logging
 
+from .utils import compute_md5_hash
+
 logger = logging.getLogger(__name__)
 
 class ConflictResolver:
@@ -16,13 +20,33 @@ class ConflictResolver:
         self.conflicts = []
         
     def detect_conflicts(self, local_files: Dict[str, str], 
-                        remote_files: List[Dict]) -> List[Dict]:
-        """Detect conflicts between local and remote files."""
+                        remote_files: Union[List[Dict], Dict[str, Dict]],
+                        shared: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Detect conflicts between local and remote files.
+
+        ``local_files`` is the name-to-hash mapping from ``get_local_files``;
+        files whose hash already matches the remote content are skipped
+        without being read from disk again. ``remote_files`` may be the
+        provider's file list or a mapping of file name to remote file. When
+        a mapping is given together with ``shared``, the names present on
+        both sides, only those files are visited.
+        """
         conflicts = []
         
+        if isinstance(remote_files, dict):
+            if shared is not None:
+                remote_files = [remote_files[name] for name in sorted(shared)]
+            else:
+                remote_files = remote_files.values()
+        
         for remote_file in remote_files:
             file_name = remote_file['file_name']
             if file_name in local_files:
+                # Compare with remote
+                remote_content = remote_file.get('content', '')
+                if local_files[file_name] == compute_md5_hash(remote_content):
+                    continue
+                
                 local_path = os.path.join(self.config.get('local_path'), file_name)
                 
                 # Read local content
@@ -33,9 +57,6 @@ class ConflictResolver:
                     logger.error(f"Error reading local file {file_name}: {e}")
                     continue
                 
-                # Compare with remote
-                remote_content = remote_file.get('content', '')
-                
                 # Check if files differ
                 if self._normalize_content(local_content) != self._normalize_content(remote_content):
                     conflicts.append({
@@ -65,6 +86,26 @@ class ConflictResolver:
         else:
             raise ValueError(f"Unknown resolution strategy: {strategy}")
     
+    def write_resolutions(self, resolutions: List[Tuple[str, str]]):
+        """Write resolved contents to their local files in one pass.
+
+        Called once after all conflicts are resolved, so prompting for the
+        next conflict is not interleaved with file writes. Content is encoded
+        once and written through a binary handle, skipping the text layer;
+        multiple files are written concurrently so disk latency overlaps.
+        """
+        writes = [(Path(local_path), content.encode('utf-8'))
+                  for local_path, content in resolutions]
+        if len(writes) <= 1:
+            for path, data in writes:
+                path.write_bytes(data)
+            return
+        
+        workers = min(len(writes), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consuming the results re-raises the first failed write
+            list(executor.map(lambda write: write[0].write_bytes(write[1]), writes))
+    
     def _interactive_resolve(self, conflict: Dict) -> str:
         """Interactive conflict resolution."""
         import click
@@ -117,25 +158,26 @@ class ConflictResolver:
         """Open conflict in external editor for resolution."""
         import click
         
-        # Create temporary file with conflict markers
-        with tempfile.NamedTemporaryFile(mode='w', suffix=f"_{conflict['file_name']}", 
-                                       delete=False) as tmp:
-            tmp.write(f"<<<<<<< LOCAL (modified: {conflict['local_modified']})\n")
-            tmp.write(conflict['local_content'])
-            tmp.write("\n=======\n")
-            tmp.write(conflict['remote_content'])
-            tmp.write(f"\n>>>>>>> REMOTE (modified: {conflict['remote_modified']})\n")
-            tmp_path = tmp.name
-        
-        # Open in editor
-        editor = os.environ.get('EDITOR', 'nano')
-        subprocess.call([editor, tmp_path])
-        
-        # Read resolved content
+        # Create temporary file with conflict markers; the suffix keeps the
+        # extension for syntax highlighting, but not the file's directories
+        fd, tmp_path = tempfile.mkstemp(suffix=f"_{os.path.basename(conflict['file_name'])}")
         try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+                tmp.write(f"<<<<<<< LOCAL (modified: {conflict['local_modified']})\n")
+                tmp.write(conflict['local_content'])
+                tmp.write("\n=======\n")
+                tmp.write(conflict['remote_content'])
+                tmp.write(f"\n>>>>>>> REMOTE (modified: {conflict['remote_modified']})\n")
+            
+            # Open in editor
+            editor = os.environ.get('EDITOR', 'nano')
+            subprocess.call([editor, tmp_path])
+            
+            # Read resolved content
             with open(tmp_path, 'r', encoding='utf-8') as f:
                 resolved_content = f.read()
         finally:
+            # Removed even if the editor cannot be started
             os.unlink(tmp_path)
         
         return resolved_content
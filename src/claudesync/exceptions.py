@@ -20,3 +20,20 @@ class ProviderError(Exception):
     """
 
     pass
+
+
+class SyncConflictError(Exception):
+    """
+    Exception raised when a sync needs conflicts resolved but cannot ask the user.
+
+    Non-interactive syncs, such as the in-process project syncs of 'workspace sync-all',
+    raise this with the conflicting paths instead of prompting, so the caller can report
+    the project and move on rather than wait for input that never comes.
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        super().__init__(
+            f"{len(self.paths)} conflict(s) need resolving: {', '.join(self.paths[:5])}"
+            + (" ..." if len(self.paths) > 5 else "")
+        )
@@ -1,26 +1,163 @@
 import os
 import time
-import subprocess
 import signal
+import socket
 import logging
+import selectors
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Set, Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from .exceptions import ProviderError
 
 logger = logging.getLogger(__name__)
 
+
+def push_changes(config):
+    """Upload local changes in-process, as ``csync sync --no-pull`` would.
+
+    Reuses the caller's config and provider instead of starting a new
+    interpreter for every sync. Errors propagate to the caller, and failed
+    uploads raise ProviderError so the sync counts as failed.
+    """
+    from .cli.sync import run_sync
+    results = run_sync(config, conflict_strategy='local-wins', no_pull=True)
+    if results and results['errors']:
+        raise ProviderError(f"{len(results['errors'])} upload(s) failed, first: {results['errors'][0]}")
+
+
+def sync_socket_path(project_path: str) -> str:
+    """Path of the Unix socket a running watcher listens on for sync requests."""
+    return os.path.join(project_path, '.claudesync', 'sync.sock')
+
+
+def request_sync(project_path: str, timeout: Optional[float] = None) -> Optional[bool]:
+    """Ask the watcher running for ``project_path`` to sync now.
+
+    Returns whether the watcher's sync succeeded, or None if no watcher is
+    listening (no socket, a stale one, or no Unix socket support), in which
+    case the caller should sync by itself.
+    """
+    path = sync_socket_path(project_path)
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(b'sync\n')
+            reply = sock.makefile('rb').readline()
+    except (ConnectionRefusedError, FileNotFoundError):
+        return None
+    return reply.strip() == b'ok'
+
+
+class SyncRequestServer:
+    """Serves sync requests from ``request_sync`` on the project's sync socket.
+
+    The listening thread blocks in a selector until a client connects or
+    ``stop`` wakes it, so an idle watcher does no work. Requests are handled
+    one at a time by calling ``callback``, which returns whether it succeeded.
+    """
+    
+    def __init__(self, path: str, callback):
+        self.path = path
+        self.callback = callback
+        self._selector = selectors.DefaultSelector()
+        self._listener: Optional[socket.socket] = None
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Bind the socket and start serving in a background thread."""
+        # A socket left behind by a watcher that died would block bind()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.path)
+        self._listener.listen()
+        self._selector.register(self._listener, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+    
+    def _serve(self):
+        while True:
+            for key, _ in self._selector.select():
+                if key.fileobj is self._wake_r:
+                    return
+                conn, _ = self._listener.accept()
+                with conn:
+                    self._handle(conn)
+    
+    def _handle(self, conn: socket.socket):
+        try:
+            if conn.makefile('rb').readline().strip() != b'sync':
+                return
+            ok = self.callback()
+            conn.sendall(b'ok\n' if ok else b'error\n')
+        except OSError as e:
+            logger.debug(f"Sync request failed: {e}")
+    
+    def stop(self):
+        """Stop serving and remove the socket."""
+        if self._thread:
+            self._wake_w.send(b'x')
+            self._thread.join()
+            self._thread = None
+        self._selector.close()
+        for sock in (self._listener, self._wake_r, self._wake_w):
+            if sock:
+                sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+class Debouncer:
+    """Calls a function once no trigger has arrived for ``delay`` seconds.
+
+    Each trigger cancels the pending timer and starts a new one, so a burst
+    of events collapses into a single call after the burst ends.
+    """
+    
+    def __init__(self, delay: float, func):
+        self.delay = delay
+        self.func = func
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+    
+    def trigger(self):
+        """(Re)start the quiet-period timer."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.func)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def cancel(self):
+        """Drop a pending call, if any."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
 class ClaudeSyncFileHandler(FileSystemEventHandler):
     """Handles file system events and triggers sync."""
     
-    def __init__(self, project_path: str, config, debounce_delay: float = 2.0):
+    def __init__(self, project_path: str, config, debounce_delay: float = 0.5):
         self.project_path = project_path
         self.config = config
         self.debounce_delay = debounce_delay
         self.pending_sync = False
         self.last_sync_time = 0
         self.modified_files: Set[str] = set()
+        # Events within the debounce window coalesce into one sync, and
+        # syncs never overlap: a burst during a sync schedules one more
+        self.debouncer = Debouncer(debounce_delay, self.check_and_sync)
+        self._sync_lock = threading.Lock()
         
         # Patterns to ignore
         self.ignore_patterns = {
@@ -59,45 +196,53 @@ class ClaudeSyncFileHandler(FileSystemEventHandler):
         # Set pending sync flag
         self.pending_sync = True
         logger.debug(f"File event: {event.event_type} - {rel_path}")
+        self.debouncer.trigger()
     
-    def check_and_sync(self):
-        """Check if sync is needed and perform it."""
-        current_time = time.time()
-        
-        if (self.pending_sync and 
-            current_time - self.last_sync_time > self.debounce_delay):
+    def sync_now(self) -> bool:
+        """Sync immediately, whether or not a change is pending."""
+        self.debouncer.cancel()
+        self.pending_sync = True
+        return self.check_and_sync()
+    
+    def check_and_sync(self) -> bool:
+        """Sync once if any change is pending; returns False if the sync failed."""
+        with self._sync_lock:
+            if not self.pending_sync:
+                return True
             
-            logger.info(f"Syncing {len(self.modified_files)} modified files...")
+            # Take the batch before syncing so events arriving meanwhile
+            # are kept for the next pass
+            self.pending_sync = False
+            modified_files, self.modified_files = self.modified_files, set()
+            logger.info(f"Syncing {len(modified_files)} modified files...")
             
             try:
-                # Run csync push
-                result = subprocess.run(
-                    ['csync', 'push'],
-                    cwd=self.project_path,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    logger.info("Sync completed successfully")
-                    self.modified_files.clear()
-                else:
-                    logger.error(f"Sync failed: {result.stderr}")
-                    
+                push_changes(self.config)
+                logger.info("Sync completed successfully")
+                ok = True
             except Exception as e:
                 logger.error(f"Error during sync: {e}")
+                # Put the batch back and retry after another quiet period
+                self.modified_files |= modified_files
+                self.pending_sync = True
+                self.debouncer.trigger()
+                ok = False
             
-            self.pending_sync = False
-            self.last_sync_time = current_time
+            self.last_sync_time = time.time()
+            return ok
 
 class FileWatcherService:
     """Main file watching service."""
     
-    def __init__(self, config):
+    def __init__(self, config, debounce_delay: float = 0.5):
         self.config = config
+        self.debounce_delay = debounce_delay
         self.observer = None
         self.handler = None
+        self.sync_server = None
         self.running = False
+        # Set by stop(); the foreground loop blocks on it instead of polling
+        self._stop_event = threading.Event()
         
     def start(self, project_path: str, daemon: bool = False):
         """Start watching for file changes."""
@@ -110,25 +255,37 @@ class FileWatcherService:
         """Start watching in foreground."""
         logger.info(f"Starting file watcher for: {project_path}")
         
-        # Create handler and observer
-        self.handler = ClaudeSyncFileHandler(project_path, self.config)
+        # Create handler and observer. watchdog's Observer is the platform's
+        # native backend (inotify on Linux, FSEvents on macOS), so the watcher
+        # sleeps until the kernel reports a change.
+        self.handler = ClaudeSyncFileHandler(project_path, self.config, self.debounce_delay)
         self.observer = Observer()
         self.observer.schedule(self.handler, project_path, recursive=True)
+        logger.debug(f"Using {type(self.observer).__name__}")
+        
+        # Let 'watch sync-now' reach this process instead of syncing itself
+        if hasattr(socket, 'AF_UNIX'):
+            self.sync_server = SyncRequestServer(sync_socket_path(project_path), self.handler.sync_now)
+            try:
+                self.sync_server.start()
+            except OSError as e:
+                logger.warning(f"Sync requests disabled, cannot listen on socket: {e}")
+                self.sync_server.stop()
+                self.sync_server = None
         
         # Set up signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
         
         # Start observer
+        self._stop_event.clear()
         self.observer.start()
         self.running = True
         
         logger.info("File watcher started. Press Ctrl+C to stop.")
         
         try:
-            while self.running:
-                self.handler.check_and_sync()
-                time.sleep(0.5)
+            self._stop_event.wait()
         finally:
             self.stop()
     
@@ -175,6 +332,12 @@ class FileWatcherService:
     def stop(self):
         """Stop the file watcher."""
         self.running = False
+        self._stop_event.set()
+        if self.sync_server:
+            self.sync_server.stop()
+            self.sync_server = None
+        if self.handler:
+            self.handler.debouncer.cancel()
         if self.observer and self.observer.is_alive():
             self.observer.stop()
             self.observer.join()
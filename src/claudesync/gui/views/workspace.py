@@ -415,7 +415,7 @@ class WorkspaceView:
                     )
                     
                     if plan.total_operations > 0:
-                        results = sync_manager.execute_plan(plan)
+                        results = sync_manager.execute_plan(plan, remote_files=remote_files)
                         up = results.get('uploaded', 0)
                         down = results.get('downloaded', 0)
                         self.gui.root.after(0, lambda: progress_text.insert("end", f" ✓ ({up} up, {down} down)"))
@@ -492,7 +492,7 @@ class WorkspaceView:
             )
             
             if plan.total_operations > 0:
-                results = sync_manager.execute_plan(plan)
+                results = sync_manager.execute_plan(plan, remote_files=remote_files)
                 messagebox.showinfo("Success", 
                     f"Sync complete for '{project_name}':\n"
                     f"Uploaded: {results.get('uploaded', 0)} files\n"
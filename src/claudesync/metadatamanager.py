@@ -10,7 +10,8 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +121,24 @@ class MetadataManager:
             return self.config.get("active_organization_id")
         return None
 
+    def get_organization_name(self) -> Optional[str]:
+        """Get the recorded organization name, if it belongs to the active organization."""
+        organization = self._metadata.get("organization")
+        if organization and organization.get("id") == self.get_organization_id():
+            return organization.get("name")
+        return None
+
+    def set_organization_name(self, organization_id: str, name: str):
+        """
+        Record the display name of the organization the project is paired with.
+
+        Args:
+            organization_id: ID of the organization
+            name: Display name of the organization
+        """
+        self._metadata["organization"] = {"id": organization_id, "name": name}
+        self._save_metadata()
+
     def get_last_sync(self) -> Optional[str]:
         """Get the last sync timestamp (ISO format)."""
         return self._metadata.get("last_sync")
@@ -141,6 +160,31 @@ class MetadataManager:
         history = self._metadata.get("sync_history", [])
         return history[-limit:]
 
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        Return the project's pairing and sync state as one read-only mapping.
+
+        Reads everything from the already-loaded metadata and config, for
+        callers such as 'status' that display all of it at once.
+
+        Returns:
+            Read-only mapping with project_id, project_name, organization_id,
+            organization_name, is_paired, last_sync, last_sync_direction and
+            last_sync_record (the most recent history entry, or None)
+        """
+        project_id = self.get_project_id()
+        history = self._metadata.get("sync_history") or []
+        return MappingProxyType({
+            "project_id": project_id,
+            "project_name": self.get_project_name(),
+            "organization_id": self.get_organization_id(),
+            "organization_name": self.get_organization_name(),
+            "is_paired": project_id is not None,
+            "last_sync": self.get_last_sync(),
+            "last_sync_direction": self.get_last_sync_direction(),
+            "last_sync_record": history[-1] if history else None,
+        })
+
     def is_paired(self) -> bool:
         """Check if project is paired with a Claude.ai project (from config)."""
         return self.get_project_id() is not None
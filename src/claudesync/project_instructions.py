@@ -17,6 +17,9 @@ class ProjectInstructions:
         "last_remote_update": None
     }
     
+    # Instructions file contents keyed by path, as ((mtime_ns, size), content)
+    _content_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+    
     def __init__(self, project_path: str):
         self.project_path = project_path
         self.config_path = os.path.join(project_path, self.CONFIG_FILE)
@@ -60,6 +63,7 @@ class ProjectInstructions:
             # Save to local .md file
             with open(self.instructions_path, 'w', encoding='utf-8') as f:
                 f.write(instructions)
+            self._cache_content(instructions)
             
             # Update config
             self.config['last_synced'] = datetime.now().isoformat()
@@ -83,8 +87,7 @@ class ProjectInstructions:
         
         try:
             # Read local instructions
-            with open(self.instructions_path, 'r', encoding='utf-8') as f:
-                instructions = f.read()
+            instructions = self.read_cached()
             
             # Update via API
             provider.update_project_instructions(organization_id, project_id, instructions)
@@ -102,7 +105,14 @@ class ProjectInstructions:
     
     def sync_instructions(self, provider, organization_id: str, project_id: str, 
                          direction: str = "both") -> Dict[str, bool]:
-        """Sync instructions in specified direction."""
+        """Sync instructions in specified direction.
+
+        The two legs of ``direction="both"`` are deliberately run one after
+        the other rather than concurrently: the pull leg rewrites the local
+        instructions file and ``self.config`` that the push leg then reads and
+        saves, so the push depends on the pull's result. Running them in
+        parallel would race on both files and could upload stale content.
+        """
         results = {"pulled": False, "pushed": False}
         
         if direction in ["pull", "both"]:
@@ -113,6 +123,26 @@ class ProjectInstructions:
         
         return results
     
+    def read_cached(self) -> str:
+        """Read the instructions file, reusing the last read while its mtime and size are unchanged."""
+        signature = self._file_signature()
+        cached = self._content_cache.get(self.instructions_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        with open(self.instructions_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._content_cache[self.instructions_path] = (signature, content)
+        return content
+    
+    def _cache_content(self, content: str):
+        """Remember content just written to the instructions file."""
+        self._content_cache[self.instructions_path] = (self._file_signature(), content)
+    
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.instructions_path)
+        return stat.st_mtime_ns, stat.st_size
+    
     def is_enabled(self) -> bool:
         """Check if instructions syncing is enabled."""
         return self.config.get('enabled', True)
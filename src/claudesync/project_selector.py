@@ -101,18 +101,24 @@ class ProjectSelector:
     def filter_projects(projects: List[Dict], 
                        search_term: str = None,
                        include_archived: bool = False) -> List[Dict]:
-        """Filter projects based on criteria."""
-        filtered = projects
-        
-        # Filter archived
-        if not include_archived:
-            filtered = [p for p in filtered if not p.get('archived_at')]
+        """Filter projects based on criteria.
+
+        Both filters are applied in a single pass, and the search term is
+        lowercased once up front rather than per project.
+        """
+        search_lower = search_term.lower() if search_term else None
         
-        # Filter by search term
-        if search_term:
-            search_lower = search_term.lower()
-            filtered = [p for p in filtered 
-                       if search_lower in p['name'].lower() 
-                       or search_lower in p['id'].lower()]
+        filtered = []
+        for p in projects:
+            # Filter archived
+            if not include_archived and p.get('archived_at'):
+                continue
+            
+            # Filter by search term
+            if search_lower and not (search_lower in p['name'].lower()
+                                     or search_lower in p['id'].lower()):
+                continue
+            
+            filtered.append(p)
         
-        return filtered
\ No newline at end of file
+        return filtered
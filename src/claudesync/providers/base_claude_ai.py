@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+import os
 import urllib
 import sseclient
 
@@ -15,6 +16,29 @@ def is_url_encoded(s):
     return decoded_s != s
 
 
+def _load_json_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_json_file(path, data):
+    """Write JSON to ``path`` atomically, ignoring failures (used for caches)."""
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not write cache {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def _get_session_key_expiry():
     while True:
         date_format = "%a, %d %b %Y %H:%M:%S %Z"
@@ -198,23 +222,59 @@ class BaseClaudeAIProvider(BaseProvider):
         return projects
 
     def list_files(self, organization_id, project_id):
+        return list(self.iter_files(organization_id, project_id))
+
+    def iter_files(self, organization_id, project_id):
+        """Yield the project's files one at a time as they are read from the response."""
         response = self._make_request(
             "GET", f"/organizations/{organization_id}/projects/{project_id}/docs"
         )
-        return [
-            {
-                "uuid": file["uuid"],
-                "file_name": file["file_name"],
-                "content": file["content"],
-                "created_at": file["created_at"],
-            }
-            for file in response
-        ]
+        for file in response:
+            yield self._file_entry(file)
+
+    def list_files_cached(self, organization_id, project_id, cache_path):
+        """List project files, revalidating a cached listing by ETag instead of refetching it.
+
+        The listing is stored in ``cache_path`` together with the ETag the
+        server sent. Later calls send that ETag as If-None-Match and reuse the
+        stored listing when the server answers 304 Not Modified.
+        """
+        endpoint = f"/organizations/{organization_id}/projects/{project_id}/docs"
+        cached = _load_json_file(cache_path)
+        if cached.get("endpoint") != endpoint or not isinstance(cached.get("files"), list):
+            cached = {}
+
+        modified, etag, response = self._make_conditional_request(
+            "GET", endpoint, cached.get("etag")
+        )
+        if not modified:
+            return cached["files"]
+
+        files = [self._file_entry(file) for file in response or []]
+        if etag:
+            _save_json_file(cache_path, {"endpoint": endpoint, "etag": etag, "files": files})
+        return files
+
+    def _make_conditional_request(self, method, endpoint, etag=None):
+        """Return (modified, etag, response) for a request revalidated with ``etag``.
+
+        Providers whose transport cannot send conditional requests always
+        fetch and report no ETag, so nothing is cached.
+        """
+        return True, None, self._make_request(method, endpoint)
+
+    @staticmethod
+    def _file_entry(file):
+        return {
+            "uuid": file["uuid"],
+            "file_name": file["file_name"],
+            "content": file["content"],
+            "created_at": file["created_at"],
+        }
 
     def get_file_content(self, organization_id, project_id, file_name):
         """Retrieve the full content of a single project file."""
-        files = self.list_files(organization_id, project_id)
-        for file in files:
+        for file in self.iter_files(organization_id, project_id):
             if file.get("file_name") == file_name:
                 return file.get("content", "")
         raise ProviderError(f"File '{file_name}' not found in project {project_id}")
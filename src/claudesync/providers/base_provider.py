@@ -24,6 +24,14 @@ class BaseProvider(ABC):
         """List all files within a specified project and organization."""
         pass
 
+    def iter_files(self, organization_id, project_id):
+        """Yield the files of a project one at a time."""
+        yield from self.list_files(organization_id, project_id)
+
+    def list_files_cached(self, organization_id, project_id, cache_path):
+        """List project files, reusing a cached listing where the provider supports it."""
+        return self.list_files(organization_id, project_id)
+
     @abstractmethod
     def get_file_content(self, organization_id, project_id, file_name):
         """Retrieve the full content of a specific file from a project."""
@@ -1,18 +1,93 @@
 import urllib.request
 import urllib.error
 import urllib.parse
+import http.client
+import io
 import json
 import gzip
+import threading
 from datetime import datetime, timezone
 from .base_claude_ai import BaseClaudeAIProvider
 from ..exceptions import ProviderError
 
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+# Methods a stale keep-alive connection may be retried with
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+class _BufferedResponse:
+    """The parts of ``http.client.HTTPResponse`` the provider uses, over a body already read."""
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self):
+        return self._body.read()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._body.close()
+
 
 class ClaudeAIProvider(BaseClaudeAIProvider):
     def __init__(self, config=None):
         super().__init__(config)
+        # Keep-alive connections, one per thread and (scheme, host)
+        self._local = threading.local()
+        # Shared HTTP/2 client, created on first use when httpx[http2] is installed
+        self._http2_client = None
+        self._http2_lock = threading.Lock()
 
     def _make_request(self, method, endpoint, data=None):
+        try:
+            req = self._build_request(method, endpoint, data)
+
+            # Make the request
+            with self._urlopen(req) as response:
+                return self._read_json(response)
+
+        except urllib.error.HTTPError as e:
+            self.handle_http_error(e)
+        except urllib.error.URLError as e:
+            self.logger.error(f"URL Error: {str(e)}")
+            raise ProviderError(f"API request failed: {str(e)}")
+
+    def _make_conditional_request(self, method, endpoint, etag=None):
+        try:
+            req = self._build_request(method, endpoint)
+            if etag:
+                req.add_header("If-None-Match", etag)
+
+            with self._urlopen(req) as response:
+                if response.status == 304:
+                    self.logger.debug(f"{endpoint} not modified since ETag {etag}")
+                    response.read()
+                    return False, etag, None
+                return True, response.headers.get("ETag"), self._read_json(response)
+
+        except urllib.error.HTTPError as e:
+            # urllib reports 304 as an error when the request went through it
+            if e.code == 304:
+                return False, etag, None
+            self.handle_http_error(e)
+        except urllib.error.URLError as e:
+            self.logger.error(f"URL Error: {str(e)}")
+            raise ProviderError(f"API request failed: {str(e)}")
+
+    def _build_request(self, method, endpoint, data=None):
         url = f"{self.base_url}{endpoint}"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0",
@@ -25,56 +100,175 @@ class ClaudeAIProvider(BaseClaudeAIProvider):
             "sessionKey": session_key,
         }
 
-        try:
-            self.logger.debug(f"Making {method} request to {url}")
-            self.logger.debug(f"Headers: {headers}")
-            self.logger.debug(f"Cookies: {cookies}")
-            if data:
-                self.logger.debug(f"Request data: {data}")
-
-            # Prepare the request
-            req = urllib.request.Request(url, method=method)
-            for key, value in headers.items():
-                req.add_header(key, value)
-
-            # Add cookies
-            cookie_string = "; ".join([f"{k}={v}" for k, v in cookies.items()])
-            req.add_header("Cookie", cookie_string)
-
-            # Add data if present
-            if data:
-                json_data = json.dumps(data).encode("utf-8")
-                req.data = json_data
+        self.logger.debug(f"Making {method} request to {url}")
+        self.logger.debug(f"Headers: {headers}")
+        self.logger.debug(f"Cookies: {cookies}")
+        if data:
+            self.logger.debug(f"Request data: {data}")
 
-            # Make the request
-            with urllib.request.urlopen(req) as response:
-                self.logger.debug(f"Response status code: {response.status}")
-                self.logger.debug(f"Response headers: {response.headers}")
+        # Prepare the request
+        req = urllib.request.Request(url, method=method)
+        for key, value in headers.items():
+            req.add_header(key, value)
 
-                # Handle gzip encoding
-                if response.headers.get("Content-Encoding") == "gzip":
-                    content = gzip.decompress(response.read())
-                else:
-                    content = response.read()
+        # Add cookies
+        cookie_string = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+        req.add_header("Cookie", cookie_string)
 
-                content_str = content.decode("utf-8")
-                self.logger.debug(f"Response content: {content_str[:1000]}...")
+        # Add data if present
+        if data:
+            json_data = json.dumps(data).encode("utf-8")
+            req.data = json_data
 
-                if not content:
-                    return None
+        return req
 
-                return json.loads(content_str)
+    def _read_json(self, response):
+        self.logger.debug(f"Response status code: {response.status}")
+        self.logger.debug(f"Response headers: {response.headers}")
 
-        except urllib.error.HTTPError as e:
-            self.handle_http_error(e)
-        except urllib.error.URLError as e:
-            self.logger.error(f"URL Error: {str(e)}")
-            raise ProviderError(f"API request failed: {str(e)}")
+        # Handle gzip encoding
+        if response.headers.get("Content-Encoding") == "gzip":
+            content = gzip.decompress(response.read())
+        else:
+            content = response.read()
+
+        content_str = content.decode("utf-8")
+        self.logger.debug(f"Response content: {content_str[:1000]}...")
+
+        if not content:
+            return None
+
+        try:
+            return json.loads(content_str)
         except json.JSONDecodeError as json_err:
             self.logger.error(f"Failed to parse JSON response: {str(json_err)}")
             self.logger.error(f"Response content: {content_str}")
             raise ProviderError(f"Invalid JSON response from API: {str(json_err)}")
 
+    def _urlopen(self, req):
+        """Send a request over a reused keep-alive connection.
+
+        Behaves like ``urllib.request.urlopen`` for the JSON API: error statuses
+        raise ``HTTPError`` and connection failures raise ``URLError``. Requests
+        that need a proxy or get redirected are handed to urllib instead, since
+        http.client applies neither. When httpx with HTTP/2 support is
+        installed, HTTPS requests are multiplexed over one shared connection
+        and httpx follows redirects itself.
+        """
+        parts = urllib.parse.urlsplit(req.full_url)
+        if parts.scheme not in ("http", "https") or (
+            parts.scheme in urllib.request.getproxies()
+            and not urllib.request.proxy_bypass(parts.hostname)
+        ):
+            return urllib.request.urlopen(req)
+        if HAS_HTTP2 and parts.scheme == "https":
+            return self._http2_urlopen(req)
+
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        headers = dict(req.header_items())
+        for attempt in range(2):
+            conn, reused = self._get_connection(parts.scheme, parts.netloc)
+            sent = False
+            try:
+                conn.request(req.get_method(), path, body=req.data, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                self._drop_connection(parts.scheme, parts.netloc)
+                # A reused connection may have been closed by the server while
+                # idle. Once the request went out it may have been processed,
+                # so from then on only methods safe to repeat are sent again
+                retry = not sent or req.get_method() in _IDEMPOTENT_METHODS
+                if reused and attempt == 0 and retry:
+                    continue
+                raise urllib.error.URLError(e)
+
+        if 300 <= response.status < 400 and response.status != 304:
+            response.read()
+            return urllib.request.urlopen(req)
+        if response.status >= 400:
+            body = response.read()
+            raise urllib.error.HTTPError(
+                req.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return response
+
+    def _http2_urlopen(self, req):
+        """Send a request through the shared httpx client, with ``_urlopen``'s error behaviour."""
+        client = self._get_http2_client()
+        request = client.build_request(
+            req.get_method(),
+            req.full_url,
+            headers=dict(req.header_items()),
+            content=req.data,
+        )
+        try:
+            # Redirects are followed here so the request is only sent once
+            response = client.send(request, stream=True, follow_redirects=True)
+            try:
+                # Raw bytes keep any Content-Encoding for _read_json to undo
+                body = b"".join(response.iter_raw())
+            finally:
+                response.close()
+        except httpx.HTTPError as e:
+            raise urllib.error.URLError(e)
+
+        # A redirect left over was not followed, e.g. it had no Location header
+        if response.status_code >= 300 and response.status_code != 304:
+            raise urllib.error.HTTPError(
+                req.full_url,
+                response.status_code,
+                response.reason_phrase,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return _BufferedResponse(
+            response.status_code, response.reason_phrase, response.headers, body
+        )
+
+    def _get_http2_client(self):
+        with self._http2_lock:
+            if self._http2_client is None:
+                # Sized to the transfer pool so parallel transfers share streams
+                workers = (
+                    self.config.get("max_download_workers", 4) if self.config else 4
+                )
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=workers, max_keepalive_connections=workers
+                    ),
+                    # Proxies are routed through urllib before reaching here
+                    trust_env=False,
+                )
+            return self._http2_client
+
+    def _get_connection(self, scheme, netloc):
+        """Return this thread's connection to ``netloc`` and whether it was used before."""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        conn = connections.get((scheme, netloc))
+        if conn is not None:
+            return conn, True
+        conn_class = (
+            http.client.HTTPSConnection
+            if scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = connections[(scheme, netloc)] = conn_class(netloc)
+        return conn, False
+
+    def _drop_connection(self, scheme, netloc):
+        conn = getattr(self._local, "connections", {}).pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
     def handle_http_error(self, e):
         self.logger.debug(f"Request failed: {str(e)}")
         self.logger.debug(f"Response status code: {e.code}")
@@ -1,7 +1,10 @@
 import functools
 import os
+import random
+import re
 import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 import io
 import unicodedata
@@ -11,7 +14,7 @@ from typing import List, Literal, Optional
 
 from tqdm import tqdm
 
-from claudesync.utils import compute_md5_hash
+from claudesync.utils import compute_md5_hash, process_file
 from claudesync.exceptions import ProviderError
 from .compression import compress_content, decompress_content
 from .conflict_resolver import ConflictResolver
@@ -21,6 +24,9 @@ from .metadatamanager import MetadataManager
 logger = logging.getLogger(__name__)
 INSTRUCTIONS_FILE = ProjectInstructions.INSTRUCTIONS_FILE
 
+# Provider errors worth retrying: 5xx responses and connection-level failures
+_TRANSIENT_ERROR_RE = re.compile(r"status code 5\d\d|^API request failed: ")
+
 # Sync Direction Enum as suggested by ChatGPT
 class SyncDirection(Enum):
     PUSH = "push"
@@ -80,8 +86,15 @@ def retry_on_403(max_retries=3, delay=1):
     return decorator
 
 
+def _remote_entries(remote_files):
+    """Return the listed remote files from a listing or a name-to-entry mapping."""
+    if isinstance(remote_files, dict):
+        return remote_files.values()
+    return remote_files or []
+
+
 class SyncManager:
-    def __init__(self, provider, config, local_path):
+    def __init__(self, provider, config, local_path, max_workers=None, upload_batch_size=None):
         self.provider = provider
         self.config = config
         self.active_organization_id = config.get("active_organization_id")
@@ -92,7 +105,10 @@ class SyncManager:
         self.max_retries = 3
         self.retry_delay = 1
         self.compression_algorithm = config.get("compression_algorithm", "none")
+        self.max_download_workers = max_workers or config.get("max_download_workers", 4)
+        self.upload_batch_size = upload_batch_size or config.get("upload_batch_size", 1)
         self.synced_files = {}
+        self._known_dirs = set()
         self.metadata_manager = MetadataManager(local_path, config=config)
 
     def build_plan(
@@ -104,12 +120,21 @@ class SyncManager:
         local_files: list,
         remote_files: list,
     ) -> SyncPlan:
-        """Build sync plan based on direction and strategy."""
+        """Build sync plan based on direction and strategy.
+
+        Files present on both sides are compared by content hash. Local hashes
+        come from the ``get_local_files`` mapping when one is passed, remote
+        hashes from the listed content, so no file is read just to plan.
+        ``remote_files`` may be the listing or a mapping of file name to
+        listed entry.
+        """
         plan = SyncPlan(actions=[], conflicts=[])
         
-        # Create lookup maps
-        remote_map = {normalize_unicode_path(f['file_name']): f for f in remote_files}
+        # Create lookup maps; the remote one is built once and walked by
+        # every branch below instead of the listing
+        remote_map = {normalize_unicode_path(f['file_name']): f for f in _remote_entries(remote_files)}
         local_map = {normalize_unicode_path(f): f for f in local_files}
+        local_hashes = local_files if isinstance(local_files, dict) else {}
         
         # Handle PUSH or BOTH - local files to upload
         if direction in (SyncDirection.PUSH, SyncDirection.BOTH):
@@ -120,60 +145,64 @@ class SyncManager:
                         action="upload",
                         path=local_file,
                         reason="New local file",
-                        local_hash=compute_md5_hash(os.path.join(self.local_path, local_file))
+                        local_hash=local_hashes.get(local_file)
                     ))
-                else:
-                    remote_file = remote_map[norm_path]
-                    local_hash = compute_md5_hash(os.path.join(self.local_path, local_file))
-                    if local_hash != remote_file.get('file_hash'):
+                elif direction == SyncDirection.PUSH:
+                    # Under BOTH a changed shared file is a conflict, planned
+                    # below; the strategy, or the caller for "prompt", turns it
+                    # into an upload or a download
+                    remote_hash = self._remote_hash(remote_map[norm_path])
+                    local_hash = self._local_hash(local_hashes, local_file)
+                    if local_hash != remote_hash:
                         plan.actions.append(PlanItem(
                             action="upload",
                             path=local_file,
                             reason="Local file modified",
                             local_hash=local_hash,
-                            remote_hash=remote_file.get('file_hash')
+                            remote_hash=remote_hash
                         ))
         
         # Handle PULL or BOTH - remote files to download
         if direction in (SyncDirection.PULL, SyncDirection.BOTH):
-            for remote_file in remote_files:
+            for norm_path, remote_file in remote_map.items():
                 file_name = remote_file['file_name']
-                norm_path = normalize_unicode_path(file_name)
+                
+                remote_hash = self._remote_hash(remote_file)
                 
                 if norm_path not in local_map:
                     plan.actions.append(PlanItem(
                         action="download",
                         path=file_name,
                         reason="New remote file",
-                        remote_hash=remote_file.get('file_hash')
+                        remote_hash=remote_hash
                     ))
                 else:
-                    local_path = os.path.join(self.local_path, file_name)
-                    if os.path.exists(local_path):
-                        local_hash = compute_md5_hash(local_path)
-                        if local_hash != remote_file.get('file_hash'):
-                            # Check for conflict
-                            if direction == SyncDirection.BOTH:
-                                plan.conflicts.append(PlanItem(
-                                    action="conflict",
-                                    path=file_name,
-                                    reason="Modified in both locations",
-                                    local_hash=local_hash,
-                                    remote_hash=remote_file.get('file_hash')
-                                ))
-                            else:
-                                plan.actions.append(PlanItem(
-                                    action="download",
-                                    path=file_name,
-                                    reason="Remote file modified",
-                                    local_hash=local_hash,
-                                    remote_hash=remote_file.get('file_hash')
-                                ))
+                    # local_map was just built from the directory walk, so the
+                    # file is known to exist without another stat() per file
+                    local_hash = self._local_hash(local_hashes, local_map[norm_path])
+                    if local_hash != remote_hash:
+                        # Check for conflict
+                        if direction == SyncDirection.BOTH:
+                            plan.conflicts.append(PlanItem(
+                                action="conflict",
+                                path=file_name,
+                                reason="Modified in both locations",
+                                local_hash=local_hash,
+                                remote_hash=remote_hash
+                            ))
+                        elif conflict_strategy != "local-wins":
+                            # Pulling with local-wins keeps the local edit
+                            plan.actions.append(PlanItem(
+                                action="download",
+                                path=file_name,
+                                reason="Remote file modified",
+                                local_hash=local_hash,
+                                remote_hash=remote_hash
+                            ))
         
         # Handle deletes if prune is enabled
         if self.config.get("prune_remote_files", True) and direction in (SyncDirection.PUSH, SyncDirection.BOTH):
-            for remote_file in remote_files:
-                norm_path = normalize_unicode_path(remote_file['file_name'])
+            for norm_path, remote_file in remote_map.items():
                 if norm_path not in local_map:
                     plan.actions.append(PlanItem(
                         action="delete_remote",
@@ -204,7 +233,24 @@ class SyncManager:
         
         return plan
     
-    def execute_plan(self, plan: SyncPlan, progress_callback=None, cancel_check=None, direction: SyncDirection = None) -> dict:
+    def _local_hash(self, local_hashes, file_path):
+        """Return a local file's content hash, reading the file only if the walk did not hash it."""
+        file_hash = local_hashes.get(file_path)
+        if file_hash is None:
+            file_hash = process_file(os.path.join(self.local_path, file_path))
+        return file_hash
+
+    @staticmethod
+    def _remote_hash(remote_file):
+        """Return a remote file's content hash, from the server if given, else from its content."""
+        if remote_file.get('file_hash'):
+            return remote_file['file_hash']
+        if 'content' in remote_file:
+            return compute_md5_hash(remote_file['content'])
+        return None
+    
+    def execute_plan(self, plan: SyncPlan, progress_callback=None, cancel_check=None, direction: SyncDirection = None,
+                     remote_files: list = None, quiet: bool = False) -> dict:
         """Execute the sync plan with progress reporting.
 
         Args:
@@ -212,6 +258,9 @@ class SyncManager:
             progress_callback: Optional callback(current, total, message)
             cancel_check: Optional callable that returns True to cancel
             direction: Sync direction for metadata tracking
+            remote_files: Optional remote listing the plan was built from, or a
+                mapping of file name to listed entry; its file contents are reused for downloads instead of refetching
+            quiet: Don't show the progress bar
 
         Returns:
             Dictionary with results
@@ -228,38 +277,64 @@ class SyncManager:
         if not total:
             return results
 
-        current = 0
-        with tqdm(total=total, desc="Syncing", unit="file", disable=progress_callback is not None) as pbar:
-            for item in plan.actions:
-                # Check for cancellation
-                if cancel_check and cancel_check():
-                    results["cancelled"] = True
-                    if progress_callback:
-                        progress_callback(current, total, "Cancelled")
-                    break
+        download_paths = [item.path for item in plan.actions if item.action == "download"]
+        self._create_parent_dirs(download_paths)
 
-                try:
-                    if progress_callback:
-                        progress_callback(current, total, f"Processing {item.path}")
-
-                    if item.action == "upload":
-                        self._upload_file(item.path)
-                        results["uploaded"] += 1
-                    elif item.action == "download":
-                        self._download_file(item.path)
-                        results["downloaded"] += 1
-                    elif item.action == "delete_remote":
-                        self._delete_remote_file(item.path)
-                        results["deleted"] += 1
-
-                    current += 1
-                    if not progress_callback:
-                        pbar.update(1)
-                    time.sleep(self.upload_delay)  # Rate limiting
+        current = 0
+        with ThreadPoolExecutor(max_workers=max(1, self.max_download_workers)) as executor, \
+                tqdm(total=total, desc="Syncing", unit="file", disable=quiet or progress_callback is not None) as pbar:
+            downloads = self._start_downloads(download_paths, remote_files, executor)
+
+            try:
+                for group in self._group_actions(plan.actions):
+                    # Check for cancellation
+                    if cancel_check and cancel_check():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        results["cancelled"] = True
+                        if progress_callback:
+                            progress_callback(current, total, "Cancelled")
+                        break
+
+                    if isinstance(group, list):
+                        if progress_callback:
+                            progress_callback(current, total, f"Uploading {len(group)} files")
+
+                        errors = self._upload_batch([item.path for item in group], executor)
+                        results["uploaded"] += len(group) - len(errors)
+                        results["errors"].extend(errors)
+
+                        current += len(group)
+                        if not progress_callback:
+                            pbar.update(len(group))
+                        time.sleep(self.upload_delay)  # Rate limiting, once per batch
+                        continue
+
+                    item = group
+                    try:
+                        if progress_callback:
+                            progress_callback(current, total, f"Processing {item.path}")
+
+                        if item.action == "download":
+                            self._download_file(item.path, content=downloads[item.path])
+                            results["downloaded"] += 1
+                        elif item.action == "delete_remote":
+                            self._delete_remote_file(item.path)
+                            results["deleted"] += 1
+
+                        current += 1
+                        if not progress_callback:
+                            pbar.update(1)
+                        if item.action != "download":
+                            time.sleep(self.upload_delay)  # Rate limiting
 
-                except Exception as e:
-                    results["errors"].append(f"{item.path}: {str(e)}")
-                    logger.error(f"Error processing {item.path}: {e}")
+                    except Exception as e:
+                        results["errors"].append(f"{item.path}: {str(e)}")
+                        logger.error(f"Error processing {item.path}: {e}")
+            except KeyboardInterrupt:
+                # Leaving the with block would otherwise wait for every queued
+                # transfer; drop them so Ctrl+C stops the sync promptly
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
         if progress_callback and not results["cancelled"]:
             progress_callback(total, total, "Complete")
@@ -276,6 +351,45 @@ class SyncManager:
 
         return results
     
+    def _group_actions(self, actions):
+        """Yield plan actions in order, with runs of uploads grouped into batches.
+
+        Consecutive upload actions are collected into lists of up to
+        ``upload_batch_size`` items; every other action is yielded on its own.
+        """
+        batch_size = max(1, self.upload_batch_size)
+        batch = []
+        for item in actions:
+            if item.action == "upload":
+                batch.append(item)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+                continue
+            if batch:
+                yield batch
+                batch = []
+            yield item
+        if batch:
+            yield batch
+
+    def _upload_batch(self, file_paths, executor):
+        """Upload a batch of files and return an error message per failed file.
+
+        The batch's uploads run concurrently on ``executor``, bounded by its
+        size (``max_download_workers``); errors are reported in plan order.
+        """
+        futures = [executor.submit(self._upload_file, path) for path in file_paths]
+
+        errors = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(f"{file_path}: {str(e)}")
+                logger.error(f"Error processing {file_path}: {e}")
+        return errors
+
     def _upload_file(self, file_path):
         """Upload a single file."""
         full_path = os.path.join(self.local_path, file_path)
@@ -292,22 +406,46 @@ class SyncManager:
             content
         )
     
-    def _download_file(self, file_path):
-        """Download a single file."""
-        remote_content = self.provider.get_file_content(
-            self.active_organization_id,
-            self.active_project_id,
-            file_path
-        )
+    def _start_downloads(self, paths, remote_files, executor):
+        """Map each planned download to its content or to a pending fetch.
+
+        Content already present in the remote listing is reused as-is. Anything
+        missing is fetched on ``executor`` (bounded by ``max_download_workers``)
+        while earlier files are being written, so disk writes overlap with the
+        remaining network round-trips.
+        """
+        listed = {f["file_name"]: f["content"] for f in _remote_entries(remote_files) if "content" in f}
+        return {
+            path: listed[path] if path in listed else executor.submit(self._fetch_file_content, path)
+            for path in paths
+        }
+
+    def _fetch_file_content(self, file_path):
+        """Fetch one remote file, retrying transient errors with jittered backoff."""
+        for attempt in range(self.max_retries):
+            try:
+                return self.provider.get_file_content(
+                    self.active_organization_id,
+                    self.active_project_id,
+                    file_path
+                )
+            except ProviderError as e:
+                if attempt == self.max_retries - 1 or not _TRANSIENT_ERROR_RE.search(str(e)):
+                    raise
+                delay = self.retry_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"Fetching {file_path} failed ({e}). Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+
+    def _download_file(self, file_path, content=None):
+        """Download a single file, using ``content`` when it is already being fetched."""
+        if isinstance(content, Future):
+            content = content.result()
+        remote_content = content if content is not None else self._fetch_file_content(file_path)
         
         if self.compression_algorithm != "none":
             remote_content = decompress_content(remote_content, self.compression_algorithm)
         
-        full_path = os.path.join(self.local_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(remote_content)
+        self._write_file(file_path, remote_content)
     
     def _delete_remote_file(self, file_path):
         """Delete a remote file."""
@@ -343,17 +481,22 @@ class SyncManager:
                         raise click.Abort()
                 else:
                     click.echo(f"Auto-resolving conflicts using strategy: {strategy}")
+                    resolutions = []
                     for conflict in conflicts:
                         resolved = resolver.resolve_conflict(conflict, strategy)
                         if resolved:
-                            with open(conflict['local_path'], 'w', encoding='utf-8') as f:
-                                f.write(resolved)
+                            resolutions.append((conflict['local_path'], resolved))
+                    resolver.write_resolutions(resolutions)
         
         # Continue with normal sync
         self.sync(local_files, remote_files)
 
     def _sync_without_compression(self, local_files, remote_files):
-        remote_files_to_delete = set(rf["file_name"] for rf in remote_files)
+        # Keep the first entry per name, as the linear lookup this replaces did
+        remote_by_name = {}
+        for rf in remote_files:
+            remote_by_name.setdefault(rf["file_name"], rf)
+        remote_files_to_delete = set(remote_by_name)
         synced_files = set()
         
         # First, check for remote project instructions and pull if needed
@@ -368,9 +511,7 @@ class SyncManager:
                     pbar.update(1)
                     continue
                     
-                remote_file = next(
-                    (rf for rf in remote_files if rf["file_name"] == local_file), None
-                )
+                remote_file = remote_by_name.get(local_file)
                 if remote_file:
                     self.update_existing_file(
                         local_file,
@@ -489,11 +630,34 @@ class SyncManager:
         if current_file:
             self._write_file(current_file, current_content.getvalue())
 
+    def _create_parent_dirs(self, file_paths):
+        """Create each distinct parent directory of ``file_paths`` once.
+
+        Sorting puts parents before their children, so every makedirs call
+        past the first only has to create its last path component. A directory
+        that can't be created is left for the file write to report.
+        """
+        parents = {os.path.dirname(os.path.join(self.local_path, p)) for p in file_paths}
+        for directory in sorted(parents - self._known_dirs):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                continue
+            self._known_dirs.add(directory)
+
     def _write_file(self, file_path, content):
+        """Write downloaded content as UTF-8 bytes.
+
+        Encoding once up front skips the text layer's chunked codec, so the
+        buffered writer hands the payload to the OS in a single write.
+        """
         full_path = os.path.join(self.local_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        directory = os.path.dirname(full_path)
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+        with open(full_path, "wb") as f:
+            f.write(content.encode("utf-8"))
 
     def _handle_project_instructions(self, local_file):
         """Handle project instructions file separately from regular file uploads."""
@@ -636,21 +800,33 @@ class SyncManager:
             return
 
         local_file_path = os.path.join(self.local_path, file_name)
-        if os.path.exists(local_file_path):
-            self.update_existing_local_file(
+        # One stat both tells whether the file exists and gives its mtime
+        try:
+            local_stat = os.stat(local_file_path)
+        except FileNotFoundError:
+            self.create_new_local_file(
                 local_file_path, remote_file, remote_files_to_delete, synced_files
             )
         else:
-            self.create_new_local_file(
-                local_file_path, remote_file, remote_files_to_delete, synced_files
+            self.update_existing_local_file(
+                local_file_path,
+                remote_file,
+                remote_files_to_delete,
+                synced_files,
+                local_mtime=local_stat.st_mtime,
             )
 
     def update_existing_local_file(
-        self, local_file_path, remote_file, remote_files_to_delete, synced_files
+        self,
+        local_file_path,
+        remote_file,
+        remote_files_to_delete,
+        synced_files,
+        local_mtime=None,
     ):
-        local_mtime = datetime.fromtimestamp(
-            os.path.getmtime(local_file_path), tz=timezone.utc
-        )
+        if local_mtime is None:
+            local_mtime = os.path.getmtime(local_file_path)
+        local_mtime = datetime.fromtimestamp(local_mtime, tz=timezone.utc)
         remote_mtime = datetime.fromisoformat(
             remote_file["created_at"].replace("Z", "+00:00")
         )
@@ -1,7 +1,13 @@
 import os
 import hashlib
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import wraps
 from pathlib import Path
+from typing import Iterator, NamedTuple
 
 import click
 import pathspec
@@ -97,7 +103,14 @@ def compute_md5_hash(content):
 
 
 def should_process_file(
-    config_manager, file_path, filename, gitignore, base_path, claudeignore
+    config_manager,
+    file_path,
+    filename,
+    gitignore,
+    base_path,
+    claudeignore,
+    file_size=None,
+    known_text=False,
 ):
     """
     Determines whether a file should be processed based on various criteria.
@@ -115,13 +128,17 @@ def should_process_file(
         gitignore (pathspec.PathSpec or None): A PathSpec object containing .gitignore patterns, if available.
         base_path (str): The base directory path of the project.
         claudeignore (pathspec.PathSpec or None): A PathSpec object containing .claudeignore patterns, if available.
+        file_size (int, optional): The file size in bytes, if the caller has already stat'ed the file.
+        known_text (bool, optional): Skip the text check for a file already known to be text.
 
     Returns:
         bool: True if the file should be processed, False otherwise.
     """
     # Check file size
     max_file_size = config_manager.get("max_file_size", 32 * 1024)
-    if os.path.getsize(file_path) > max_file_size:
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
+    if file_size > max_file_size:
         return False
 
     # Skip temporary editor files
@@ -139,7 +156,7 @@ def should_process_file(
         return False
 
     # Check if it's a text file
-    return is_text_file(file_path)
+    return known_text or is_text_file(file_path)
 
 
 def process_file(file_path):
@@ -167,23 +184,45 @@ def process_file(file_path):
     return None
 
 
-def get_local_files(config, local_path, category=None, include_submodules=False):
+def iter_local_tree(local_path, skip_dir=None):
     """
-    Retrieves a dictionary of local files within a specified path, applying various filters.
+    Walks a directory tree with os.scandir and yields the files it contains.
+
+    Directories are recursed with an explicit stack rather than os.walk, and file
+    types are taken from the DirEntry, which on most platforms comes straight from
+    the directory listing without an extra stat call. Symlinked directories are not
+    followed, matching os.walk's default.
 
     Args:
-        config: config manager to use
-        local_path (str): The base directory path to search for files.
-        category (str, optional): The file category to filter by.
-        include_submodules (bool, optional): Whether to include files from submodules.
+        local_path (str): The base directory path to walk.
+        skip_dir (callable, optional): Called as skip_dir(rel_path, name) for each
+                                       subdirectory; returning True prunes it.
 
-    Returns:
-        dict: A dictionary where keys are relative file paths, and values are MD5 hashes of the file contents.
+    Yields:
+        tuple: (relative_path, os.DirEntry) for every regular file, or symlink to one.
     """
-    gitignore = load_gitignore(local_path)
-    claudeignore = load_claudeignore(local_path)
-    files = {}
-    exclude_dirs = {
+    stack = [(local_path, "")]
+    while stack:
+        dir_path, rel_root = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_root, entry.name)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (skip_dir and skip_dir(rel_path, entry.name)):
+                                stack.append((entry.path, rel_path))
+                        elif entry.is_file():
+                            yield rel_path, entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+# Directories that are never synced, whatever the ignore files say
+EXCLUDED_DIRS = frozenset(
+    {
         ".git",
         ".svn",
         ".hg",
@@ -193,6 +232,44 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
         "claude_chats",
         ".claudesync",
     }
+)
+
+
+class _LocalFileEntry(NamedTuple):
+    """A local file accepted for syncing, as produced by _iter_local_files."""
+
+    path: str
+    hash: str
+    size: int
+    mtime_ns: int
+
+
+def _iter_local_files(
+    config, local_path, category=None, include_submodules=False, manifest=None
+) -> Iterator[_LocalFileEntry]:
+    """
+    Walks a local directory and yields the files that should be synced, applying various filters.
+
+    Files whose hash the manifest already has are yielded as the walk reaches them. The rest
+    are hashed once the walk is done, across processes when there are many (see the
+    "hash_workers" setting); no file contents are kept.
+
+    Args:
+        config: config manager to use. Directory names listed in its "exclude_dirs" setting
+                are pruned along with EXCLUDED_DIRS, before the walk descends into them.
+        local_path (str): The base directory path to search for files.
+        category (str, optional): The file category to filter by.
+        include_submodules (bool, optional): Whether to include files from submodules.
+        manifest (dict, optional): Maps relative paths to [mtime_ns, size, hash] from an earlier
+                                   walk. Files whose mtime and size still match reuse the stored
+                                   hash instead of being read; the dict is updated in place.
+
+    Yields:
+        _LocalFileEntry: The relative path, MD5 hash, size and mtime of each file.
+    """
+    gitignore = load_gitignore(local_path)
+    claudeignore = load_claudeignore(local_path)
+    exclude_dirs = EXCLUDED_DIRS.union(config.get("exclude_dirs", []))
 
     categories = config.get("file_categories", {})
     if category and category not in categories:
@@ -206,40 +283,185 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
 
     submodules = config.get("submodules", [])
     submodule_paths = [sm["relative_path"] for sm in submodules]
+    # (rel_path, path, size, mtime_ns) of files that still need hashing
+    pending = []
 
-    for root, dirs, filenames in os.walk(local_path, topdown=True):
-        rel_root = os.path.relpath(root, local_path)
-        rel_root = "" if rel_root == "." else rel_root
-
+    def skip_dir(rel_dir, name):
+        if name in exclude_dirs:
+            return True
         # Skip submodule directories if not including submodules
-        if not include_submodules:
-            dirs[:] = [
-                d for d in dirs if os.path.join(rel_root, d) not in submodule_paths
-            ]
-
-        dirs[:] = [
-            d
-            for d in dirs
-            if d not in exclude_dirs
-            and not (gitignore and gitignore.match_file(os.path.join(rel_root, d)))
-            and not (
-                claudeignore and claudeignore.match_file(os.path.join(rel_root, d))
-            )
-        ]
-
-        for filename in filenames:
-            rel_path = os.path.join(rel_root, filename)
-            full_path = os.path.join(root, filename)
-
-            if rel_path == ProjectInstructions.INSTRUCTIONS_FILE:
-                continue
-
-            if spec.match_file(rel_path) and should_process_file(
-                config, full_path, filename, gitignore, local_path, claudeignore
-            ):
-                file_hash = process_file(full_path)
-                if file_hash:
-                    files[rel_path] = file_hash
+        if not include_submodules and rel_dir in submodule_paths:
+            return True
+        if gitignore and gitignore.match_file(rel_dir):
+            return True
+        return bool(claudeignore and claudeignore.match_file(rel_dir))
+
+    for rel_path, entry in iter_local_tree(local_path, skip_dir):
+        if rel_path == ProjectInstructions.INSTRUCTIONS_FILE:
+            continue
+
+        if not spec.match_file(rel_path):
+            continue
+
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        file_size = stat.st_size
+
+        cached = manifest.get(rel_path) if manifest is not None else None
+        unchanged = cached is not None and cached[:2] == [stat.st_mtime_ns, file_size]
+
+        if should_process_file(
+            config,
+            entry.path,
+            entry.name,
+            gitignore,
+            local_path,
+            claudeignore,
+            file_size=file_size,
+            known_text=unchanged,
+        ):
+            if unchanged:
+                yield _LocalFileEntry(rel_path, cached[2], file_size, stat.st_mtime_ns)
+            else:
+                pending.append((rel_path, entry.path, file_size, stat.st_mtime_ns))
+
+    # Files whose hash is not known yet are hashed after the walk, so a large
+    # batch can be spread over several processes
+    hashes = _hash_files(
+        [path for _, path, _, _ in pending], config.get("hash_workers")
+    )
+    for (rel_path, _, file_size, mtime_ns), file_hash in zip(pending, hashes):
+        if file_hash:
+            if manifest is not None:
+                manifest[rel_path] = [mtime_ns, file_size, file_hash]
+            yield _LocalFileEntry(rel_path, file_hash, file_size, mtime_ns)
+
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_HASH_MIN_FILES = 256
+
+
+def _hash_files(paths, workers=None):
+    """
+    Hashes files with process_file, in a process pool when there are enough of them.
+
+    Decoding and hashing are CPU-bound and hold the GIL, so threads would not help.
+    Workers are spawned rather than forked: this may run on a workspace sync
+    thread, and forking a threaded process can deadlock the child on a lock
+    another thread held. Falls back to hashing in this process if a pool
+    cannot be started.
+
+    Args:
+        paths (list): Absolute paths of the files to hash.
+        workers (int, optional): Number of worker processes; defaults to the CPU count.
+                                 1 hashes everything in this process.
+
+    Returns:
+        list: The hash of each file, or None where process_file gave none, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(paths) >= PARALLEL_HASH_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return list(executor.map(process_file, paths, chunksize=64))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.debug(f"Could not hash files in parallel, hashing serially: {e}")
+    return [process_file(path) for path in paths]
+
+
+def get_local_files(
+    config,
+    local_path,
+    category=None,
+    include_submodules=False,
+    sizes=None,
+    manifest=None,
+):
+    """
+    Retrieves a dictionary of local files within a specified path, applying various filters.
+
+    Args:
+        config: config manager to use
+        local_path (str): The base directory path to search for files.
+        category (str, optional): The file category to filter by.
+        include_submodules (bool, optional): Whether to include files from submodules.
+        sizes (dict, optional): If given, filled with the size in bytes of each returned file,
+                                taken from the same stat used for the size filter.
+        manifest (dict, optional): Passed through to _iter_local_files.
+
+    Returns:
+        dict: A dictionary where keys are relative file paths, and values are MD5 hashes of the file contents.
+    """
+    files = {}
+    for entry in _iter_local_files(
+        config, local_path, category, include_submodules, manifest=manifest
+    ):
+        files[entry.path] = entry.hash
+        if sizes is not None:
+            sizes[entry.path] = entry.size
+    return files
+
+
+LOCAL_MANIFEST_FILE = os.path.join(".claudesync", "cache", "local_manifest.json")
+
+# Files modified this recently are rehashed next time: a later write within
+# the same timestamp granularity would leave mtime and size unchanged
+RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+
+def get_local_files_cached(
+    config, local_path, category=None, include_submodules=False, sizes=None
+):
+    """
+    Like get_local_files, but skips re-reading files that have not changed since the last call.
+
+    Each file's mtime, size and hash are kept in .claudesync/cache/local_manifest.json
+    under the project. Files whose mtime and size match the manifest reuse the stored hash;
+    only new or modified files are read and hashed.
+
+    Returns:
+        dict: A dictionary where keys are relative file paths, and values are MD5 hashes of the file contents.
+    """
+    manifest_path = os.path.join(local_path, LOCAL_MANIFEST_FILE)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if not isinstance(manifest, dict):
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+
+    files = get_local_files(
+        config,
+        local_path,
+        category=category,
+        include_submodules=include_submodules,
+        sizes=sizes,
+        manifest=manifest,
+    )
+
+    # Drop entries for files that are gone or too recent to trust
+    racy_after = time.time_ns() - RACY_MTIME_WINDOW_NS
+    if category is None:
+        manifest = {path: entry for path, entry in manifest.items() if path in files}
+    manifest = {
+        path: entry for path, entry in manifest.items() if entry[0] < racy_after
+    }
+
+    tmp_path = f"{manifest_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.debug(f"Could not write local file manifest: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
     return files
 
@@ -292,6 +514,11 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
                             require_org is True and no active organization ID is set,
                             or if require_project is True and no active project ID is set.
         ProviderError: If the session key has expired.
+
+    Note:
+        When called inside a Click command, the provider instance is cached on the
+        invocation's context (keyed by provider name and organization ID), so loops
+        that call this repeatedly reuse a single provider for the whole invocation.
     """
     if require_org and not config.get("active_organization_id"):
         raise ConfigurationError(
@@ -315,7 +542,17 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
             f"No valid session key found for {active_provider}. Please log in again."
         )
 
-    return get_provider(config, active_provider)
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return get_provider(config, active_provider)
+
+    provider_cache = ctx.meta.setdefault("claudesync.provider_cache", {})
+    cache_key = (id(config), active_provider, config.get("active_organization_id"))
+    provider = provider_cache.get(cache_key)
+    if provider is None:
+        provider = get_provider(config, active_provider)
+        provider_cache[cache_key] = provider
+    return provider
 
 
 def validate_and_store_local_path(config):
@@ -1,7 +1,8 @@
 import os
+import copy
 import json
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 class WorkspaceConfig:
     """Manages workspace configuration for ClaudeSync."""
@@ -18,27 +19,42 @@ class WorkspaceConfig:
         ]
     }
     
+    # Last parsed config file as ((path, mtime_ns, size), config), so the
+    # several WorkspaceConfig() instances one command creates parse it once
+    _parsed_cache: Optional[Tuple[Tuple[str, int, int], Dict]] = None
+    
     def __init__(self):
         self.config = self._load_config()
     
     def _load_config(self) -> Dict:
         """Load configuration from file or create default."""
-        if os.path.exists(self.CONFIG_FILE):
-            try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults for any missing keys
-                    for key, value in self.DEFAULT_CONFIG.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
-            except Exception:
-                return self.DEFAULT_CONFIG.copy()
-        return self.DEFAULT_CONFIG.copy()
+        try:
+            stat = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return copy.deepcopy(self.DEFAULT_CONFIG)
+        
+        signature = (self.CONFIG_FILE, stat.st_mtime_ns, stat.st_size)
+        cached = WorkspaceConfig._parsed_cache
+        if cached and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+        
+        try:
+            with open(self.CONFIG_FILE, 'r') as f:
+                config = json.load(f)
+                # Merge with defaults for any missing keys
+                for key, value in self.DEFAULT_CONFIG.items():
+                    if key not in config:
+                        config[key] = copy.deepcopy(value)
+        except Exception:
+            return copy.deepcopy(self.DEFAULT_CONFIG)
+        
+        WorkspaceConfig._parsed_cache = (signature, copy.deepcopy(config))
+        return config
     
     def _save_config(self):
         """Save configuration to file."""
         os.makedirs(os.path.dirname(self.CONFIG_FILE), exist_ok=True)
+        WorkspaceConfig._parsed_cache = None
         with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(self.config, f, indent=2, ensure_ascii=False)
     
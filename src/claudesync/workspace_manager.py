@@ -1,24 +1,58 @@
 import os
 import subprocess
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from contextlib import nullcontext
+from typing import Callable, List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import click
 import time
 import json
 import logging
+from claudesync.exceptions import SyncConflictError
 from claudesync.project_instructions import ProjectInstructions
 
 logger = logging.getLogger(__name__)
 
+
+def _decode_output(data: Optional[bytes]) -> str:
+    """Decode captured subprocess output, replacing invalid characters.
+
+    Output is captured as bytes and only decoded when it is actually shown,
+    so successful runs never pay for decoding.
+    """
+    return data.decode('utf-8', errors='replace') if data else ''
+
+
 class WorkspaceManager:
     """Manages multiple ClaudeSync projects in a workspace."""
     
+    PROJECT_SET_FILE = os.path.expanduser("~/.claudesync/project_set.json")
+    PROJECT_SET_TTL = 600  # seconds before a full walk is forced again
+    
     def __init__(self, workspace_config):
         self.config = workspace_config
+        # Walk results for this manager's lifetime, keyed by walk parameters,
+        # as (root mtime_ns, projects)
+        self._discovered: Dict[Tuple, Tuple[int, List[Dict]]] = {}
     
-    def discover_projects(self, root_path: Optional[str] = None) -> List[Dict]:
-        """Discover all ClaudeSync projects in the workspace."""
+    def discover_projects(self, root_path: Optional[str] = None, use_cache: bool = False,
+                          max_depth: Optional[int] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Discover all ClaudeSync projects in the workspace.
+        
+        With ``use_cache``, the projects found by a recent walk of the same root
+        are revalidated with one stat() each (see ``fast_rediscover``) instead
+        of walking the tree again. Adding or removing an entry directly under
+        the root changes its mtime and forces a new walk; projects created
+        deeper down only show up once the cache expires or a revalidation
+        finds it stale.
+        
+        ``max_depth`` overrides the configured search depth. With ``limit`` the
+        walk stops once that many projects are found, for callers that only
+        preview a few; such partial results are never cached.
+        
+        Complete results are also kept on this manager and reused while the
+        root's mtime is unchanged, so a command that discovers more than once
+        walks the tree once. ``invalidate_discovery`` drops them.
+        """
         if root_path is None:
             root_path = self.config.get_workspace_root()
             if not root_path:
@@ -28,44 +62,189 @@ class WorkspaceManager:
                 else:
                     return []
         
-        projects = []
         exclude_patterns = self.config.config.get("exclude_patterns", [])
-        max_depth = self.config.config.get("max_search_depth", 3)
-        
-        # Walk directory tree
-        for root, dirs, files in os.walk(root_path):
-            # Calculate depth
-            depth = len(Path(root).relative_to(root_path).parts)
-            if depth > max_depth:
-                dirs.clear()  # Don't go deeper
-                continue
-            
-            # Remove excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_patterns]
-            
-            # Check for .claudesync directory
-            if '.claudesync' in dirs:
-                config_file = os.path.join(root, '.claudesync', 'config.local.json')
-                if os.path.exists(config_file):
+        if max_depth is None:
+            max_depth = self.config.config.get("max_search_depth", 3)
+        if limit is not None:
+            use_cache = False
+        cache_key = [os.path.abspath(root_path), max_depth, exclude_patterns]
+        memo_key = (cache_key[0], max_depth, tuple(exclude_patterns))
+        
+        try:
+            root_mtime = os.stat(root_path).st_mtime_ns
+        except OSError:
+            root_mtime = None
+            use_cache = False
+        
+        if limit is None and root_mtime is not None:
+            memo = self._discovered.get(memo_key)
+            if memo and memo[0] == root_mtime:
+                return list(memo[1])
+        
+        projects = None
+        if use_cache:
+            cached = self._load_project_set(cache_key, root_mtime)
+            if cached is not None:
+                projects, stale = self.fast_rediscover(cached)
+                if stale:
+                    projects = None
+        
+        if projects is None:
+            projects = self._walk_projects(root_path, exclude_patterns, max_depth, limit)
+            if use_cache:
+                self._save_project_set(cache_key, projects, root_mtime)
+        
+        if limit is None and root_mtime is not None:
+            self._discovered[memo_key] = (root_mtime, projects)
+        return list(projects)
+    
+    def invalidate_discovery(self):
+        """Forget the projects found by earlier discover_projects calls."""
+        self._discovered.clear()
+    
+    def _walk_projects(self, root_path: str, exclude_patterns: List[str], max_depth: int,
+                       limit: Optional[int] = None) -> List[Dict]:
+        """Walk the workspace tree looking for .claudesync project configs.
+
+        Each top-level directory is walked on its own thread: on network
+        mounts the walk waits on directory listings rather than the CPU, so
+        discovery takes about as long as the deepest subtree, not their sum.
+        With ``limit``, all threads stop once that many projects are found
+        between them.
+        """
+        exclude = set(exclude_patterns)
+        project, subdirs = self._scan_project_dir(root_path, root_path, exclude)
+        if project:
+            return [project]
+        if max_depth < 1 or not subdirs:
+            return []
+        
+        # Shared by the walker threads; list.append is atomic
+        projects = []
+        with ThreadPoolExecutor(max_workers=min(32, len(subdirs))) as executor:
+            list(executor.map(
+                lambda top: self._walk_subtree(top, root_path, exclude, max_depth, projects, limit),
+                subdirs
+            ))
+        
+        projects.sort(key=lambda p: p['relative_path'])
+        return projects[:limit] if limit is not None else projects
+    
+    def _walk_subtree(self, top: str, root_path: str, exclude: set, max_depth: int,
+                      projects: List[Dict], limit: Optional[int] = None):
+        """Add the projects under ``top``, a directory one level below the workspace root, to ``projects``."""
+        stack = [(top, 1)]
+        while stack:
+            if limit is not None and len(projects) >= limit:
+                return
+            path, depth = stack.pop()
+            project, subdirs = self._scan_project_dir(path, root_path, exclude)
+            if project:
+                # Don't descend into this project directory
+                projects.append(project)
+            elif depth < max_depth:
+                stack.extend((subdir, depth + 1) for subdir in subdirs)
+    
+    def _scan_project_dir(self, path: str, root_path: str, exclude: set) -> Tuple[Optional[Dict], List[str]]:
+        """List one directory with os.scandir.
+
+        Returns the directory's project entry if it holds a valid .claudesync
+        config, otherwise ``None`` and the subdirectories to descend into.
+        Excluded and symlinked directories are not descended into.
+        """
+        subdirs = []
+        has_config_dir = False
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in exclude:
+                        continue
                     try:
-                        import json
-                        with open(config_file, 'r') as f:
-                            project_config = json.load(f)
-                        
-                        projects.append({
-                            'path': root,
-                            'name': project_config.get('active_project_name', 'Unknown'),
-                            'id': project_config.get('active_project_id', 'Unknown'),
-                            'relative_path': os.path.relpath(root, root_path)
-                        })
-                        
-                        # Don't descend into this project directory  
-                        dirs.clear()
-                    except Exception:
-                        # Invalid config, skip
-                        pass
-        
-        return sorted(projects, key=lambda p: p['relative_path'])
+                        if entry.name == '.claudesync':
+                            has_config_dir = entry.is_dir()
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            return None, []
+        
+        if has_config_dir:
+            config_file = os.path.join(path, '.claudesync', 'config.local.json')
+            try:
+                with open(config_file, 'r') as f:
+                    project_config = json.load(f)
+                return {
+                    'path': path,
+                    'name': project_config.get('active_project_name', 'Unknown'),
+                    'id': project_config.get('active_project_id', 'Unknown'),
+                    'relative_path': os.path.relpath(path, root_path)
+                }, []
+            except Exception:
+                # Missing or invalid config, keep walking
+                pass
+        
+        return None, subdirs
+    
+    def fast_rediscover(self, cached: Dict[str, Dict]) -> Tuple[List[Dict], bool]:
+        """Revalidate previously discovered projects without walking the tree.
+        
+        ``cached`` maps each project path to ``{"mtime": ..., "project": {...}}``
+        as saved after the last walk. Each project's config.local.json is
+        stat()ed once; the result is stale if any config is gone or changed.
+        
+        Returns:
+            Tuple of (projects, stale)
+        """
+        projects = []
+        for path, entry in cached.items():
+            config_file = os.path.join(path, '.claudesync', 'config.local.json')
+            try:
+                mtime = os.stat(config_file).st_mtime
+            except OSError:
+                return [], True
+            if mtime != entry.get('mtime'):
+                return [], True
+            projects.append(entry['project'])
+        
+        return sorted(projects, key=lambda p: p['relative_path']), False
+    
+    def _load_project_set(self, cache_key: List, root_mtime: int) -> Optional[Dict[str, Dict]]:
+        """Load the saved project set if it belongs to this walk, is recent and the root is unchanged."""
+        try:
+            with open(self.PROJECT_SET_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if data.get('key') != cache_key or data.get('root_mtime') != root_mtime:
+            return None
+        if time.time() - data.get('saved_at', 0) > self.PROJECT_SET_TTL:
+            return None
+        return data.get('projects')
+    
+    def _save_project_set(self, cache_key: List, projects: List[Dict], root_mtime: int):
+        """Save the discovered projects with their config mtimes, atomically."""
+        entries = {}
+        for project in projects:
+            config_file = os.path.join(project['path'], '.claudesync', 'config.local.json')
+            try:
+                entries[project['path']] = {
+                    'mtime': os.stat(config_file).st_mtime,
+                    'project': project,
+                }
+            except OSError:
+                continue
+        
+        data = {'key': cache_key, 'root_mtime': root_mtime, 'saved_at': time.time(), 'projects': entries}
+        tmp_path = f"{self.PROJECT_SET_FILE}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.PROJECT_SET_FILE), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.PROJECT_SET_FILE)
+        except OSError as e:
+            logger.debug(f"Could not save project set: {e}")
     
     def analyze_project_changes(self, project: Dict, sync_options: Dict) -> Dict:
         """Analyze what changes would be made to a project during sync."""
@@ -196,8 +375,14 @@ class WorkspaceManager:
     def sync_all_projects(self, projects: Optional[List[Dict]] = None,
                          sync_options: Optional[Dict] = None,
                          parallel: bool = True,
-                         dry_run: bool = False) -> List[Dict]:
-        """Sync all projects in the workspace with options."""
+                         dry_run: bool = False,
+                         on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Sync all projects in the workspace with options.
+
+        ``on_result``, if given, is called with each project's result as soon
+        as that project finishes, in completion order; the progress bar is
+        then left out so the streamed lines are not overdrawn.
+        """
         if projects is None:
             projects = self.discover_projects()
         
@@ -218,61 +403,179 @@ class WorkspaceManager:
         parallel_workers = sync_options.get('parallel_workers', 4)
         
         if parallel and parallel_workers > 1:
-            results = self._sync_parallel(projects, sync_options, parallel_workers)
+            results = self._sync_parallel(projects, sync_options, parallel_workers, on_result)
         else:
-            results = self._sync_sequential(projects, sync_options)
+            results = self._sync_sequential(projects, sync_options, on_result)
         
         return results
     
-    def _sync_parallel(self, projects: List[Dict], sync_options: Dict, max_workers: int = 4) -> List[Dict]:
-        """Sync projects in parallel."""
+    def _sync_parallel(self, projects: List[Dict], sync_options: Dict, max_workers: int = 4,
+                       on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Sync projects in parallel, handling each result as it completes."""
         results = []
         
-        with click.progressbar(length=len(projects), 
-                             label='Syncing projects') as bar:
+        progress = (click.progressbar(length=len(projects), label='Syncing projects')
+                    if on_result is None else nullcontext())
+        with progress as bar, \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(projects))) as executor:
+            # Submit all sync tasks
+            future_to_project = {
+                executor.submit(self._sync_single_project, project, sync_options): project
+                for project in projects
+            }
             
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all sync tasks
-                future_to_project = {
-                    executor.submit(self._sync_single_project, project, sync_options): project
-                    for project in projects
-                }
-                
+            try:
                 # Process completed tasks
                 for future in as_completed(future_to_project):
                     project = future_to_project[future]
                     try:
-                        result = future.result(timeout=300)  # 5 minute timeout
-                        results.append(result)
+                        result = future.result()
                     except Exception as e:
-                        results.append({
+                        result = {
                             'project': project['name'],
                             'path': project['path'],
                             'status': 'error',
                             'message': str(e),
                             'duration': 0
-                        })
-                    finally:
+                        }
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                    else:
                         bar.update(1)
+            except KeyboardInterrupt:
+                # Don't start the projects still queued
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         return results
     
-    def _sync_sequential(self, projects: List[Dict], sync_options: Dict) -> List[Dict]:
+    def _sync_sequential(self, projects: List[Dict], sync_options: Dict,
+                         on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         """Sync projects sequentially."""
         results = []
         
-        with click.progressbar(projects, 
-                             label='Syncing projects',
-                             item_show_func=lambda p: p['name'] if p else '') as bar:
+        progress = (click.progressbar(projects,
+                                      label='Syncing projects',
+                                      item_show_func=lambda p: p['name'] if p else '')
+                    if on_result is None else nullcontext(projects))
+        with progress as bar:
             
             for project in bar:
                 result = self._sync_single_project(project, sync_options)
                 results.append(result)
+                if on_result:
+                    on_result(result)
         
         return results
     
     def _sync_single_project(self, project: Dict, sync_options: Dict) -> Dict:
-        """Sync a single project with TRUE bidirectional sync."""
+        """Sync a single project with TRUE bidirectional sync.
+
+        The sync runs in this process through ``run_sync``, saving an
+        interpreter start per project. With the ``isolate`` option each project
+        is synced by a separate ``csync`` process instead.
+        """
+        if sync_options.get('isolate'):
+            return self._sync_single_project_isolated(project, sync_options)
+        
+        start_time = time.time()
+        
+        try:
+            results = self._run_project_sync(project, sync_options)
+        except SyncConflictError as e:
+            return {
+                'project': project['name'],
+                'path': project['path'],
+                'status': 'conflict',
+                'message': f"{e}; skipped, run 'csync sync' in the project to resolve them",
+                'duration': time.time() - start_time
+            }
+        except Exception as e:
+            return {
+                'project': project['name'],
+                'path': project['path'],
+                'status': 'error',
+                'message': str(e) or e.__class__.__name__,
+                'duration': time.time() - start_time
+            }
+        
+        if results and results['errors']:
+            return {
+                'project': project['name'],
+                'path': project['path'],
+                'status': 'failed',
+                'message': f"{len(results['errors'])} error(s), first: {results['errors'][0]}",
+                'duration': time.time() - start_time
+            }
+        
+        details = ''
+        if sync_options.get('with_instructions'):
+            details = '(with instructions)'
+        
+        return {
+            'project': project['name'],
+            'path': project['path'],
+            'status': 'success',
+            'message': 'Synced successfully',
+            'details': details,
+            'duration': time.time() - start_time
+        }
+    
+    def _run_project_sync(self, project: Dict, sync_options: Dict):
+        """Run the equivalent of the csync instructions and sync commands for one project.
+
+        Returns what ``run_sync`` returns.
+        """
+        # Imported here so the workspace commands do not load the sync machinery
+        from claudesync.cli.sync import run_sync
+        from claudesync.configmanager import FileConfigManager
+        from claudesync.utils import validate_and_get_provider
+        
+        config = FileConfigManager(project['path'])
+        
+        # Overrides only touch this in-memory config, so unlike 'csync config set'
+        # nothing is written to disk and parallel syncs cannot see each other's
+        if not sync_options.get('prune_remote', True):
+            config.global_config['prune_remote_files'] = False
+        if not sync_options.get('prune_local', True):
+            config.global_config['prune_local_files'] = False
+        
+        pull_only = sync_options.get('pull_only')
+        push_only = sync_options.get('push_only')
+        
+        if sync_options.get('with_instructions', True):  # Default to True
+            direction = 'pull' if pull_only else 'push' if push_only else 'both'
+            try:
+                provider = validate_and_get_provider(config, require_project=True)
+                instructions = ProjectInstructions(config.get_local_path() or project['path'])
+                instructions.sync_instructions(
+                    provider,
+                    config.get('active_organization_id'),
+                    config.get('active_project_id'),
+                    direction,
+                )
+            except Exception as e:
+                # Don't fail if instructions sync fails, just log it
+                logger.debug(f"Instructions {direction} failed for {project['name']}: {e}")
+        
+        # Pushing always keeps local files; a pull with local-wins keeps local
+        # edits instead of downloading over them
+        conflict_strategy = 'local-wins' if push_only else sync_options.get('conflict_strategy', 'prompt')
+        
+        # Nobody can answer a prompt from a worker thread with quiet output,
+        # so conflicts under the prompt strategy skip the project instead
+        return run_sync(
+            config,
+            conflict_strategy=conflict_strategy,
+            no_pull=bool(push_only),
+            no_push=bool(pull_only),
+            interactive=False,
+            quiet=True,
+        )
+    
+    def _sync_single_project_isolated(self, project: Dict, sync_options: Dict) -> Dict:
+        """Sync a single project by running csync in a subprocess."""
         start_time = time.time()
         
         try:
@@ -294,8 +597,8 @@ class WorkspaceManager:
             
             # Run config commands
             for config_cmd in config_cmds:
-                subprocess.run(config_cmd, cwd=project['path'], capture_output=True, text=True,
-                              encoding='utf-8', errors='replace')
+                subprocess.run(config_cmd, cwd=project['path'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             # Determine sync direction
             if sync_options.get('pull_only'):
@@ -304,15 +607,16 @@ class WorkspaceManager:
                     instructions_result = subprocess.run(
                         ['csync', 'project', 'instructions', 'pull'],
                         cwd=project['path'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
                         timeout=30
                     )
                     # Don't fail if instructions pull fails
                     if instructions_result.returncode != 0:
-                        logger.debug(f"Instructions pull failed for {project['name']}: {instructions_result.stderr}")
+                        logger.debug(
+                            f"Instructions pull failed for {project['name']}: "
+                            f"{_decode_output(instructions_result.stderr)}"
+                        )
                 
                 # Then do regular pull
                 cmd.append('pull')
@@ -328,15 +632,16 @@ class WorkspaceManager:
                         instructions_result = subprocess.run(
                             ['csync', 'project', 'instructions', 'push'],
                             cwd=project['path'],
-                            capture_output=True,
-                            text=True,
-                            encoding='utf-8',
-                            errors='replace',
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
                             timeout=30
                         )
                         # Don't fail if instructions push fails
                         if instructions_result.returncode != 0:
-                            logger.debug(f"Instructions push failed for {project['name']}: {instructions_result.stderr}")
+                            logger.debug(
+                                f"Instructions push failed for {project['name']}: "
+                                f"{_decode_output(instructions_result.stderr)}"
+                            )
                 
                 # Then do regular push
                 cmd.append('push')
@@ -348,15 +653,16 @@ class WorkspaceManager:
                     instructions_result = subprocess.run(
                         ['csync', 'project', 'instructions', 'sync'],
                         cwd=project['path'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
                         timeout=30
                     )
                     # Don't fail if instructions sync fails, just log it
                     if instructions_result.returncode != 0:
-                        logger.debug(f"Instructions sync failed for {project['name']}: {instructions_result.stderr}")
+                        logger.debug(
+                            f"Instructions sync failed for {project['name']}: "
+                            f"{_decode_output(instructions_result.stderr)}"
+                        )
                 
                 # Step 2: Use the sync command for true bidirectional sync
                 cmd.append('sync')
@@ -373,10 +679,8 @@ class WorkspaceManager:
             result = subprocess.run(
                 cmd,
                 cwd=project['path'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',  # Handle unicode properly
-                errors='replace',   # Replace invalid chars instead of failing
+                stdout=subprocess.DEVNULL,  # Only stderr is reported, on failure
+                stderr=subprocess.PIPE,
                 timeout=300  # 5 minute timeout
             )
             
@@ -390,8 +694,8 @@ class WorkspaceManager:
                     reset_cmd = ['csync', 'config', 'set', 'two_way_sync', 'false']
                 else:
                     continue
-                subprocess.run(reset_cmd, cwd=project['path'], capture_output=True, text=True,
-                              encoding='utf-8', errors='replace')
+                subprocess.run(reset_cmd, cwd=project['path'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             duration = time.time() - start_time
             
@@ -413,7 +717,7 @@ class WorkspaceManager:
                     'project': project['name'],
                     'path': project['path'],
                     'status': 'failed',
-                    'message': result.stderr.strip() or 'Unknown error',
+                    'message': _decode_output(result.stderr).strip() or 'Unknown error',
                     'duration': duration
                 }
         
@@ -510,7 +814,12 @@ class WorkspaceManager:
     
     def pull_all_chats(self, projects: Optional[List[Dict]] = None,
                       safety_options: Dict = None) -> List[Dict]:
-        """Pull chats for all projects."""
+        """Pull chats for all projects.
+
+        When ``safety_options`` is given without ``skip_errors``, the first
+        failing project stops the run and the remaining projects are not
+        started.
+        """
         if projects is None:
             projects = self.discover_projects()
         
@@ -519,8 +828,10 @@ class WorkspaceManager:
         
         results = []
         safety_args = []
+        stop_on_error = False
         
         if safety_options:
+            stop_on_error = not safety_options.get('skip_errors', False)
             if safety_options.get('dry_run'):
                 safety_args.append('--dry-run')
             if safety_options.get('backup_existing'):
@@ -528,6 +839,11 @@ class WorkspaceManager:
         
         # Process projects with detailed feedback
         for idx, project in enumerate(projects, 1):
+            if stop_on_error and results and results[-1]['status'] != 'success':
+                click.echo(f"\nStopping after failure, {len(projects) - idx + 1} project(s) not processed. "
+                           f"Use --skip-errors to continue past failures.")
+                break
+            
             project_name = project['name']
             click.echo(f"\n[{idx}/{len(projects)}] Processing: {project_name}")
             
@@ -628,6 +944,22 @@ class WorkspaceManager:
         
         return results
     
+    @staticmethod
+    def _watcher_running(project_path: str) -> bool:
+        """Check whether the project's file watcher process is alive.
+
+        The pid file is opened directly instead of checking for it first,
+        saving a stat per project.
+        """
+        pid_file = os.path.join(project_path, '.claudesync', 'watch.pid')
+        try:
+            with open(pid_file, 'r') as f:
+                pid = int(f.read().strip())
+            os.kill(pid, 0)  # Check if process exists
+            return True
+        except (OSError, ValueError):
+            return False
+    
     def get_status(self, projects: Optional[List[Dict]] = None) -> Dict:
         """Get status summary for all projects."""
         if projects is None:
@@ -639,20 +971,15 @@ class WorkspaceManager:
             'projects': []
         }
         
-        for project in projects:
-            # Check for file watcher
-            pid_file = os.path.join(project['path'], '.claudesync', 'watch.pid')
-            watcher_running = False
-            
-            if os.path.exists(pid_file):
-                try:
-                    with open(pid_file, 'r') as f:
-                        pid = int(f.read().strip())
-                    os.kill(pid, 0)  # Check if process exists
-                    watcher_running = True
-                except:
-                    pass
-            
+        # The pid file reads are independent, so on high-latency mounts they
+        # run in parallel rather than one round trip after another
+        if projects:
+            with ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+                watchers = list(executor.map(self._watcher_running, [p['path'] for p in projects]))
+        else:
+            watchers = []
+        
+        for project, watcher_running in zip(projects, watchers):
             status['projects'].append({
                 'name': project['name'],
                 'path': project['relative_path'],
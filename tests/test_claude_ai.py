@@ -74,6 +74,28 @@ class TestClaudeAIProvider(unittest.TestCase):
         self.assertEqual(files[0]["uuid"], "file1")
         self.assertEqual(files[0]["file_name"], "test.txt")
 
+    def test_get_file_content_returns_matching_file(self):
+        with patch.object(
+            self.provider,
+            "_make_request",
+            return_value=[
+                {
+                    "uuid": "file1",
+                    "file_name": "a.txt",
+                    "content": "A",
+                    "created_at": "2023-01-01T00:00:00Z",
+                },
+                {
+                    "uuid": "file2",
+                    "file_name": "b.txt",
+                    "content": "B",
+                    "created_at": "2023-01-01T00:00:00Z",
+                },
+            ],
+        ):
+            content = self.provider.get_file_content("org1", "proj1", "b.txt")
+        self.assertEqual(content, "B")
+
     def test_upload_file(self):
         with patch.object(
             self.provider, "_make_request", return_value={"uuid": "file1"}
@@ -160,5 +182,224 @@ class TestClaudeAIProvider(unittest.TestCase):
         self.assertIn("403 Forbidden error", str(context.exception))
 
 
+def test_requests_reuse_keep_alive_connection():
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    client_ports = []
+
+    class KeepAliveHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            body = json.dumps(
+                [
+                    {
+                        "uuid": "org1",
+                        "name": "Org",
+                        "capabilities": ["chat", "claude_pro"],
+                    }
+                ]
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        config = InMemoryConfigManager()
+        config.set("claude_api_url", f"http://127.0.0.1:{server.server_port}/api")
+        provider = ClaudeAIProvider(config)
+
+        assert provider.get_organizations() == [{"id": "org1", "name": "Org"}]
+        assert provider.get_organizations() == [{"id": "org1", "name": "Org"}]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(client_ports) == 2
+    assert len(set(client_ports)) == 1
+
+
+def test_only_idempotent_requests_are_resent_after_a_dropped_response():
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    received = []
+
+    class DroppingHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        handled = 0
+
+        def _respond(self):
+            received.append(self.command)
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            # One handler serves one connection; the second request on it is
+            # read and then dropped without a response
+            self.handled += 1
+            if self.handled == 2:
+                self.close_connection = True
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        do_GET = do_POST = _respond
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DroppingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        config = InMemoryConfigManager()
+        config.set("claude_api_url", f"http://127.0.0.1:{server.server_port}/api")
+
+        provider = ClaudeAIProvider(config)
+        provider._make_request("GET", "/a")
+        assert provider._make_request("GET", "/a") == {}
+        assert received == ["GET"] * 3
+
+        provider = ClaudeAIProvider(config)
+        provider._make_request("POST", "/b", {"x": 1})
+        try:
+            provider._make_request("POST", "/b", {"x": 1})
+        except ProviderError:
+            pass
+        else:
+            raise AssertionError("a POST that reached the server should not be resent")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == ["GET"] * 3 + ["POST"] * 2
+
+
+def test_list_files_cached_revalidates_with_etag(tmp_path):
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    conditional_headers = []
+
+    class ETagHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            conditional_headers.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(
+                [
+                    {
+                        "uuid": "file1",
+                        "file_name": "a.txt",
+                        "content": "A",
+                        "created_at": "2023-01-01T00:00:00Z",
+                    }
+                ]
+            ).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        config = InMemoryConfigManager()
+        config.set("claude_api_url", f"http://127.0.0.1:{server.server_port}/api")
+        provider = ClaudeAIProvider(config)
+        cache_path = str(tmp_path / "cache" / "remote_manifest.json")
+
+        first = provider.list_files_cached("org1", "proj1", cache_path)
+        second = provider.list_files_cached("org1", "proj1", cache_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first == second
+    assert second[0]["file_name"] == "a.txt"
+    assert conditional_headers == [None, '"v1"']
+
+
+def test_http2_requests_follow_redirects_in_httpx(monkeypatch):
+    import types
+    import urllib.request
+
+    from claudesync.providers import claude_ai
+
+    sent = []
+
+    class FakeResponse:
+        def __init__(self, status_code, reason_phrase, body):
+            self.status_code = status_code
+            self.reason_phrase = reason_phrase
+            self.headers = {}
+            self._body = body
+
+        def iter_raw(self):
+            yield self._body
+
+        def close(self):
+            pass
+
+    class FakeClient:
+        responses = []
+
+        def __init__(self, **kwargs):
+            pass
+
+        def build_request(self, method, url, headers=None, content=None):
+            return (method, url)
+
+        def send(self, request, stream=False, follow_redirects=False):
+            sent.append((request, follow_redirects))
+            return self.responses.pop(0)
+
+    fake_httpx = types.SimpleNamespace(
+        Client=FakeClient,
+        Limits=lambda **kwargs: None,
+        HTTPError=type("HTTPError", (Exception,), {}),
+    )
+    monkeypatch.setattr(claude_ai, "httpx", fake_httpx, raising=False)
+    monkeypatch.setattr(claude_ai, "HAS_HTTP2", True)
+
+    def fail_urlopen(req):
+        raise AssertionError("request was sent again through urllib")
+
+    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
+
+    config = InMemoryConfigManager()
+    config.set("claude_api_url", "https://claude.example/api")
+    provider = ClaudeAIProvider(config)
+
+    body = b'[{"uuid": "org1", "name": "Org", "capabilities": ["chat", "claude_pro"]}]'
+    FakeClient.responses = [FakeResponse(200, "OK", body)]
+    assert provider.get_organizations() == [{"id": "org1", "name": "Org"}]
+    assert sent == [(("GET", "https://claude.example/api/organizations"), True)]
+
+    # A redirect httpx could not follow is an error, not a second request
+    FakeClient.responses = [FakeResponse(302, "Found", b"")]
+    try:
+        provider.get_organizations()
+    except ProviderError as e:
+        assert "302" in str(e)
+    else:
+        raise AssertionError("an unfollowed redirect should fail")
+    assert len(sent) == 2
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import pytest
+
+from claudesync.conflict_resolver import ConflictResolver
+from claudesync.utils import compute_md5_hash
+
+
+class DummyConfig:
+    def __init__(self, local_path):
+        self.values = {"local_path": local_path}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def test_detect_conflicts_skips_files_with_matching_hash(tmp_path, monkeypatch):
+    (tmp_path / "same.txt").write_text("same", encoding="utf-8")
+    (tmp_path / "changed.txt").write_text("local", encoding="utf-8")
+    local_files = {
+        "same.txt": compute_md5_hash("same"),
+        "changed.txt": compute_md5_hash("local"),
+    }
+    remote_files = [
+        {
+            "file_name": "same.txt",
+            "content": "same",
+            "created_at": "2024-01-01T00:00:00Z",
+        },
+        {
+            "file_name": "changed.txt",
+            "content": "remote",
+            "created_at": "2024-01-01T00:00:00Z",
+        },
+    ]
+
+    opened = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    conflicts = ConflictResolver(DummyConfig(str(tmp_path))).detect_conflicts(
+        local_files, remote_files
+    )
+
+    assert [c["file_name"] for c in conflicts] == ["changed.txt"]
+    assert opened == [str(tmp_path / "changed.txt")]
+
+
+def test_write_resolutions_writes_each_file(tmp_path):
+    first = tmp_path / "a.txt"
+    second = tmp_path / "b.txt"
+    first.write_text("old", encoding="utf-8")
+
+    ConflictResolver(DummyConfig(str(tmp_path))).write_resolutions(
+        [(str(first), "new ✓"), (str(second), "created")]
+    )
+
+    assert first.read_text(encoding="utf-8") == "new ✓"
+    assert second.read_text(encoding="utf-8") == "created"
+
+
+def test_external_editor_temp_file_is_removed_when_editor_fails(tmp_path, monkeypatch):
+    import tempfile
+
+    from claudesync import conflict_resolver
+
+    def missing_editor(args):
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(conflict_resolver.subprocess, "call", missing_editor)
+    conflict = {
+        "file_name": "docs/a.md",
+        "local_content": "local",
+        "remote_content": "remote",
+        "local_modified": "now",
+        "remote_modified": "then",
+    }
+
+    with pytest.raises(FileNotFoundError):
+        ConflictResolver(DummyConfig(str(tmp_path)))._edit_in_external_editor(conflict)
+
+    assert list(tmp_path.iterdir()) == []
@@ -39,3 +39,49 @@ def test_local_config_persists_without_existing_project_folder(tmp_path, monkeyp
     assert reloaded.local_config_dir == workspace
     assert reloaded.get_active_provider() == "claude.ai"
     assert reloaded.get("active_organization_id") == "org-123"
+
+
+def test_local_config_loads_from_explicit_project_path(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+
+    project = tmp_path / "project"
+    (project / ".claudesync").mkdir(parents=True)
+    (project / ".claudesync" / "config.local.json").write_text(
+        json.dumps({"active_provider": "claude.ai", "active_project_id": "proj-1"})
+    )
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    manager = FileConfigManager(str(project))
+
+    assert manager.get_local_path() == str(project)
+    assert manager.get("active_project_id") == "proj-1"
+
+
+def test_setting_unchanged_local_value_skips_write(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+
+    project = tmp_path / "project"
+    (project / ".claudesync").mkdir(parents=True)
+    config_file = project / ".claudesync" / "config.local.json"
+    config_file.write_text(json.dumps({"active_provider": "claude.ai"}))
+
+    manager = FileConfigManager(str(project))
+    sentinel = '{"active_provider": "claude.ai", "untouched": true}'
+    config_file.write_text(sentinel)
+
+    manager.set("active_provider", "claude.ai", local=True)
+    manager._save_local_config()
+    assert config_file.read_text() == sentinel
+
+    manager.set("active_project_id", "proj-2", local=True)
+    assert json.loads(config_file.read_text()) == {
+        "active_provider": "claude.ai",
+        "active_project_id": "proj-2",
+    }
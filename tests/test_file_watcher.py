@@ -0,0 +1,90 @@
+import threading
+
+from claudesync import file_watcher
+from claudesync.file_watcher import (
+    ClaudeSyncFileHandler,
+    Debouncer,
+    SyncRequestServer,
+    request_sync,
+    sync_socket_path,
+)
+
+
+class Event:
+    is_directory = False
+    event_type = "modified"
+
+    def __init__(self, src_path):
+        self.src_path = src_path
+
+
+def test_debouncer_coalesces_bursts():
+    called = threading.Event()
+    calls = []
+    debouncer = Debouncer(0.05, lambda: calls.append(1) or called.set())
+
+    for _ in range(20):
+        debouncer.trigger()
+
+    assert called.wait(2)
+    debouncer.cancel()
+    assert calls == [1]
+
+
+def test_handler_syncs_once_per_burst(tmp_path, monkeypatch):
+    synced = threading.Event()
+    calls = []
+    monkeypatch.setattr(
+        file_watcher,
+        "push_changes",
+        lambda config: calls.append(config) or synced.set(),
+    )
+    config = object()
+    handler = ClaudeSyncFileHandler(str(tmp_path), config, debounce_delay=0.05)
+
+    for i in range(10):
+        handler.on_any_event(Event(str(tmp_path / f"file{i}.txt")))
+
+    assert synced.wait(2)
+    handler.debouncer.cancel()
+    assert calls == [config]
+    assert handler.modified_files == set()
+    assert not handler.pending_sync
+
+
+def test_sync_requests_reach_running_watcher(tmp_path):
+    (tmp_path / ".claudesync").mkdir()
+    assert request_sync(str(tmp_path)) is None
+
+    outcomes = iter([True, False])
+    server = SyncRequestServer(sync_socket_path(str(tmp_path)), lambda: next(outcomes))
+    server.start()
+    try:
+        assert request_sync(str(tmp_path), timeout=5) is True
+        assert request_sync(str(tmp_path), timeout=5) is False
+    finally:
+        server.stop()
+
+    assert request_sync(str(tmp_path)) is None
+
+
+def test_handler_retries_failed_sync(tmp_path, monkeypatch):
+    synced = threading.Event()
+    calls = []
+
+    def push_changes(config):
+        calls.append(config)
+        if len(calls) == 1:
+            raise RuntimeError("network down")
+        synced.set()
+
+    monkeypatch.setattr(file_watcher, "push_changes", push_changes)
+    handler = ClaudeSyncFileHandler(str(tmp_path), object(), debounce_delay=0.05)
+
+    handler.on_any_event(Event(str(tmp_path / "file.txt")))
+
+    assert synced.wait(2)
+    handler.debouncer.cancel()
+    assert len(calls) == 2
+    assert handler.modified_files == set()
+    assert not handler.pending_sync
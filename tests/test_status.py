@@ -0,0 +1,69 @@
+import json
+
+from claudesync.cli import status as status_module
+
+
+class DummyConfig:
+    def get(self, key, default=None):
+        return {"active_provider": "claude.ai"}.get(key, default)
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = 0
+
+    def get_organizations(self):
+        self.calls += 1
+        return [{"id": "org-1", "name": "Acme"}]
+
+
+def test_organization_name_is_served_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        status_module, "ORGANIZATIONS_CACHE_FILE", str(tmp_path / "organizations.json")
+    )
+    provider = CountingProvider()
+    monkeypatch.setattr(
+        status_module, "validate_and_get_provider", lambda *a, **kw: provider
+    )
+
+    assert status_module._get_organization_name(DummyConfig(), "org-1") == "Acme"
+    assert status_module._get_organization_name(DummyConfig(), "org-1") == "Acme"
+    assert provider.calls == 1
+
+    cache_file = tmp_path / "organizations.json"
+    cache = json.loads(cache_file.read_text())
+    cache["claude.ai"]["fetched_at"] -= status_module.ORGANIZATIONS_CACHE_TTL + 1
+    cache_file.write_text(json.dumps(cache))
+
+    assert status_module._get_organization_name(DummyConfig(), "org-1") == "Acme"
+    assert provider.calls == 2
+
+
+def test_format_size_picks_unit_at_thresholds():
+    assert status_module.format_size(0) == "0 B"
+    assert status_module.format_size(1023) == "1023 B"
+    assert status_module.format_size(1024) == "1.0 KB"
+    assert status_module.format_size(1536) == "1.5 KB"
+    assert status_module.format_size(1024**2) == "1.0 MB"
+    assert status_module.format_size(5 * 1024**3) == "5.0 GB"
+    assert status_module.format_size(2 * 1024**4) == "2.0 TB"
+
+
+def test_pluralize():
+    assert status_module.pluralize(1, "file") == "file"
+    assert status_module.pluralize(0, "file") == "files"
+    assert status_module.pluralize(2, "entry", "entries") == "entries"
+
+
+def test_unknown_organization_does_not_refetch_fresh_list(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        status_module, "ORGANIZATIONS_CACHE_FILE", str(tmp_path / "organizations.json")
+    )
+    provider = CountingProvider()
+    monkeypatch.setattr(
+        status_module, "validate_and_get_provider", lambda *a, **kw: provider
+    )
+
+    assert status_module._get_organization_name(DummyConfig(), "org-2") is None
+    assert status_module._get_organization_name(DummyConfig(), "org-2") is None
+    assert provider.calls == 1
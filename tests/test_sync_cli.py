@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+
+import pytest
+
+from claudesync.cli.sync import run_sync
+from claudesync.configmanager import InMemoryConfigManager
+from claudesync.exceptions import ConfigurationError, ProviderError
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    config = InMemoryConfigManager()
+    config.set("local_path", str(tmp_path))
+    config.set("active_organization_id", "org")
+    config.set("active_project_id", "proj")
+    config.set("active_project_name", "proj")
+    config.set("upload_delay", 0)
+    monkeypatch.setattr(config, "get_local_path", lambda: str(tmp_path))
+
+    provider = Mock()
+    provider.list_files_cached.return_value = [
+        {
+            "uuid": "1",
+            "file_name": "a.txt",
+            "content": "remote old",
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+    ]
+    monkeypatch.setattr(
+        "claudesync.cli.sync.validate_and_get_provider", lambda *a, **k: provider
+    )
+    (tmp_path / "a.txt").write_text("local edit", encoding="utf-8")
+    return config, provider, tmp_path
+
+
+def answer(monkeypatch, choice):
+    monkeypatch.setattr("click.confirm", lambda *a, **k: True)
+    monkeypatch.setattr("click.prompt", lambda *a, **k: choice)
+
+
+def uploads(provider):
+    return [c.args[2:] for c in provider.upload_file.call_args_list]
+
+
+def test_prompted_conflict_kept_local_is_uploaded(project, monkeypatch):
+    config, provider, path = project
+    answer(monkeypatch, "l")
+
+    run_sync(config)
+
+    assert uploads(provider) == [("a.txt", "local edit")]
+    assert (path / "a.txt").read_text(encoding="utf-8") == "local edit"
+
+
+def test_prompted_conflict_kept_remote_is_not_uploaded(project, monkeypatch):
+    config, provider, path = project
+    answer(monkeypatch, "r")
+
+    run_sync(config)
+
+    provider.upload_file.assert_not_called()
+    assert (path / "a.txt").read_text(encoding="utf-8") == "remote old"
+
+
+def test_whitespace_only_local_edit_is_uploaded_without_asking(project, monkeypatch):
+    config, provider, path = project
+    provider.list_files_cached.return_value[0]["content"] = "same"
+    (path / "a.txt").write_text("same\n", encoding="utf-8")
+    answer(monkeypatch, None)
+    monkeypatch.setattr("click.prompt", Mock(side_effect=AssertionError("prompted")))
+
+    run_sync(config)
+
+    assert uploads(provider) == [("a.txt", "same\n")]
+
+
+def test_quiet_sync_prints_nothing(project, capsys):
+    config, provider, path = project
+    (path / "new.txt").write_text("new", encoding="utf-8")
+
+    run_sync(config, conflict_strategy="local-wins", quiet=True)
+
+    assert uploads(provider) == [("new.txt", "new"), ("a.txt", "local edit")]
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_failed_uploads_are_returned(project):
+    config, provider, path = project
+    provider.upload_file.side_effect = ProviderError("boom")
+
+    results = run_sync(config, conflict_strategy="local-wins", quiet=True)
+
+    assert results["uploaded"] == 0
+    assert results["errors"] == ["a.txt: boom"]
+
+
+def test_conflicting_direction_flags_raise(project):
+    config, provider, path = project
+
+    with pytest.raises(ConfigurationError):
+        run_sync(config, no_pull=True, no_push=True)
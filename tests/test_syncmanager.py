@@ -0,0 +1,154 @@
+from unittest.mock import Mock
+
+from claudesync.exceptions import ProviderError
+from claudesync.syncmanager import PlanItem, SyncManager, SyncPlan
+
+
+class DummyConfig:
+    def __init__(self, **values):
+        self.values = {"upload_delay": 0, **values}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _download_plan(*paths):
+    return SyncPlan(
+        actions=[
+            PlanItem(action="download", path=p, reason="New remote file") for p in paths
+        ],
+        conflicts=[],
+    )
+
+
+def test_execute_plan_reuses_listed_content_and_fetches_the_rest(tmp_path):
+    provider = Mock()
+    provider.get_file_content.return_value = "fetched"
+    manager = SyncManager(provider, DummyConfig(), str(tmp_path))
+    manager.retry_delay = 0
+
+    remote_files = [{"file_name": "listed.txt", "content": "listed"}]
+    results = manager.execute_plan(
+        _download_plan("listed.txt", "sub/missing.txt"), remote_files=remote_files
+    )
+
+    assert results["downloaded"] == 2
+    assert (tmp_path / "listed.txt").read_text(encoding="utf-8") == "listed"
+    assert (tmp_path / "sub" / "missing.txt").read_text(encoding="utf-8") == "fetched"
+    provider.get_file_content.assert_called_once_with(None, None, "sub/missing.txt")
+
+
+def test_execute_plan_retries_transient_fetch_errors(tmp_path):
+    provider = Mock()
+    provider.get_file_content.side_effect = [
+        ProviderError("API request failed with status code 502: Bad Gateway"),
+        "recovered",
+    ]
+    manager = SyncManager(provider, DummyConfig(), str(tmp_path))
+    manager.retry_delay = 0
+
+    results = manager.execute_plan(_download_plan("a.txt"))
+
+    assert results["errors"] == []
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "recovered"
+
+
+def test_build_plan_compares_content_hashes(tmp_path):
+    from claudesync.utils import get_local_files
+    from claudesync.syncmanager import SyncDirection
+
+    (tmp_path / "same.txt").write_text("same", encoding="utf-8")
+    (tmp_path / "changed.txt").write_text("local", encoding="utf-8")
+    manager = SyncManager(Mock(), DummyConfig(), str(tmp_path))
+
+    def plan_for(direction, conflict_strategy):
+        return manager.build_plan(
+            direction=direction,
+            dry_run=True,
+            conflict_strategy=conflict_strategy,
+            local_files=get_local_files(DummyConfig(), str(tmp_path)),
+            remote_files=[
+                {"file_name": "same.txt", "content": "same"},
+                {"file_name": "changed.txt", "content": "remote"},
+            ],
+        )
+
+    # Under BOTH a file changed on either side is only a conflict
+    plan = plan_for(SyncDirection.BOTH, "prompt")
+    assert [(a.action, a.path) for a in plan.actions] == []
+    assert [c.path for c in plan.conflicts] == ["changed.txt"]
+
+    # and resolving it plans exactly one transfer
+    plan = plan_for(SyncDirection.BOTH, "remote-wins")
+    assert [(a.action, a.path) for a in plan.actions] == [("download", "changed.txt")]
+    plan = plan_for(SyncDirection.BOTH, "local-wins")
+    assert [(a.action, a.path) for a in plan.actions] == [("upload", "changed.txt")]
+
+    plan = plan_for(SyncDirection.PUSH, "local-wins")
+    assert [(a.action, a.path) for a in plan.actions] == [("upload", "changed.txt")]
+
+
+def test_execute_plan_pauses_once_per_upload_batch(tmp_path, monkeypatch):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    provider = Mock()
+    provider.upload_file.side_effect = [None, ProviderError("boom"), None]
+    manager = SyncManager(provider, DummyConfig(), str(tmp_path), upload_batch_size=2)
+    sleeps = []
+    monkeypatch.setattr("claudesync.syncmanager.time.sleep", sleeps.append)
+
+    plan = SyncPlan(
+        actions=[
+            PlanItem(action="upload", path=p, reason="New local file")
+            for p in ("a.txt", "b.txt", "c.txt")
+        ],
+        conflicts=[],
+    )
+    results = manager.execute_plan(plan)
+
+    assert results["uploaded"] == 2
+    assert results["errors"] == ["b.txt: boom"]
+    assert provider.upload_file.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_build_plan_accepts_remote_files_by_name(tmp_path):
+    from claudesync.syncmanager import SyncDirection
+    from claudesync.utils import get_local_files
+
+    (tmp_path / "local.txt").write_text("local", encoding="utf-8")
+    manager = SyncManager(Mock(), DummyConfig(), str(tmp_path))
+    remote_files = [{"file_name": "remote.txt", "content": "remote"}]
+
+    def plan_for(remote):
+        plan = manager.build_plan(
+            direction=SyncDirection.BOTH,
+            dry_run=True,
+            conflict_strategy="prompt",
+            local_files=get_local_files(DummyConfig(), str(tmp_path)),
+            remote_files=remote,
+        )
+        return [(a.action, a.path) for a in plan.actions]
+
+    by_name = {f["file_name"]: f for f in remote_files}
+    assert plan_for(by_name) == plan_for(remote_files)
+    assert ("download", "remote.txt") in plan_for(by_name)
+
+
+def test_pull_with_local_wins_keeps_local_edits(tmp_path):
+    from claudesync.syncmanager import SyncDirection
+
+    manager = SyncManager(Mock(), DummyConfig(), str(tmp_path))
+    plan = manager.build_plan(
+        direction=SyncDirection.PULL,
+        dry_run=False,
+        conflict_strategy="local-wins",
+        local_files={"changed.txt": "local-hash"},
+        remote_files=[
+            {"file_name": "changed.txt", "content": "remote"},
+            {"file_name": "new.txt", "content": "new"},
+        ],
+    )
+
+    assert [(a.action, a.path) for a in plan.actions] == [("download", "new.txt")]
+    assert plan.conflicts == []
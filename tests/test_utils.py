@@ -1,3 +1,5 @@
+import os
+
 from claudesync import utils
 from claudesync.project_instructions import ProjectInstructions
 
@@ -18,3 +20,141 @@ def test_get_local_files_excludes_project_instructions(tmp_path):
 
     assert ProjectInstructions.INSTRUCTIONS_FILE not in files
     assert "notes.txt" in files
+
+
+def test_validate_and_get_provider_reuses_instance_within_invocation():
+    from datetime import datetime, timedelta
+
+    import click
+
+    from claudesync.configmanager import InMemoryConfigManager
+
+    config = InMemoryConfigManager()
+    config.set("active_provider", "claude.ai", local=True)
+    config.set("active_organization_id", "org-1", local=True)
+    config.set_session_key(
+        "claude.ai", "sk-ant-test", datetime.now() + timedelta(days=1)
+    )
+
+    with click.Context(click.Command("dummy"), obj=config):
+        first = utils.validate_and_get_provider(config)
+        assert utils.validate_and_get_provider(config) is first
+
+    with click.Context(click.Command("dummy"), obj=config):
+        assert utils.validate_and_get_provider(config) is not first
+
+
+def test_get_local_files_reports_sizes_from_walk(tmp_path):
+    (tmp_path / "a.txt").write_text("hello", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("hi", encoding="utf-8")
+
+    sizes = {}
+    files = utils.get_local_files(DummyConfig(), str(tmp_path), sizes=sizes)
+
+    assert sizes.keys() == files.keys()
+    assert sum(sizes.values()) == 7
+
+
+def test_get_local_files_prunes_excluded_directories(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text("x", encoding="utf-8")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("print()", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text("build/\n", encoding="utf-8")
+
+    files = utils.get_local_files(DummyConfig(), str(tmp_path))
+
+    assert set(files) == {".gitignore", os.path.join("src", "main.py")}
+
+
+def test_get_local_files_cached_skips_rehashing_unchanged_files(tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("hello", encoding="utf-8")
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+
+    first = utils.get_local_files_cached(DummyConfig(), str(tmp_path))
+    assert (tmp_path / utils.LOCAL_MANIFEST_FILE).exists()
+
+    hashed = []
+    process_file = utils.process_file
+    monkeypatch.setattr(
+        utils, "process_file", lambda p: hashed.append(p) or process_file(p)
+    )
+
+    assert utils.get_local_files_cached(DummyConfig(), str(tmp_path)) == first
+    assert hashed == []
+
+    path.write_text("hello, world", encoding="utf-8")
+    second = utils.get_local_files_cached(DummyConfig(), str(tmp_path))
+    assert hashed == [str(path)]
+    assert second["a.txt"] != first["a.txt"]
+
+
+def test_get_local_files_prunes_configured_exclude_dirs(tmp_path):
+    from claudesync.configmanager import InMemoryConfigManager
+
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x", encoding="utf-8")
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "lib.js").write_text("x", encoding="utf-8")
+    (tmp_path / "app.js").write_text("x", encoding="utf-8")
+
+    config = InMemoryConfigManager()
+    config.set("exclude_dirs", config._get_default_config()["exclude_dirs"])
+    assert set(utils.get_local_files(config, str(tmp_path))) == {
+        "app.js",
+        os.path.join("vendor", "lib.js"),
+    }
+
+    config.set("exclude_dirs", ["node_modules", "vendor"])
+    assert set(utils.get_local_files(config, str(tmp_path))) == {"app.js"}
+
+
+def test_get_local_files_hashes_in_parallel_like_serially(tmp_path, monkeypatch):
+    for i in range(8):
+        (tmp_path / f"f{i}.txt").write_text(f"content {i}", encoding="utf-8")
+
+    class Config(DummyConfig):
+        def __init__(self, workers):
+            self.workers = workers
+
+        def get(self, key, default=None):
+            return self.workers if key == "hash_workers" else default
+
+    serial = utils.get_local_files(Config(1), str(tmp_path))
+    monkeypatch.setattr(utils, "PARALLEL_HASH_MIN_FILES", 2)
+    assert utils.get_local_files(Config(2), str(tmp_path)) == serial
+    assert len(serial) == 8
+
+
+def test_hash_files_spawns_workers_when_called_off_main_thread(tmp_path, monkeypatch):
+    import threading
+
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(f"content {i}", encoding="utf-8")
+        paths.append(str(path))
+
+    start_methods = []
+    real_executor = utils.ProcessPoolExecutor
+
+    def recording_executor(*args, **kwargs):
+        start_methods.append(kwargs["mp_context"].get_start_method())
+        return real_executor(*args, **kwargs)
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", recording_executor)
+    monkeypatch.setattr(utils, "PARALLEL_HASH_MIN_FILES", 2)
+
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(hashes=utils._hash_files(paths, workers=2))
+    )
+    thread.start()
+    thread.join(timeout=60)
+
+    assert start_methods == ["spawn"]
+    assert result["hashes"] == [utils.process_file(path) for path in paths]
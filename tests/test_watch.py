@@ -0,0 +1,18 @@
+from claudesync.cli.watch import _tail_lines
+
+
+def test_tail_lines_returns_the_last_lines(tmp_path):
+    log = tmp_path / "watch.log"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+
+    assert _tail_lines(str(log), 3) == ["line 997", "line 998", "line 999"]
+    assert _tail_lines(str(log), 2000) == [f"line {i}" for i in range(1000)]
+
+
+def test_tail_lines_handles_empty_and_unterminated_files(tmp_path):
+    log = tmp_path / "watch.log"
+    log.write_bytes(b"")
+    assert _tail_lines(str(log)) == []
+
+    log.write_bytes(b"first\nlast")
+    assert _tail_lines(str(log), 1) == ["last"]
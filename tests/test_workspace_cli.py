@@ -0,0 +1,29 @@
+from claudesync.cli.workspace import _name_matcher
+
+
+def matching(pattern, names):
+    matches = _name_matcher(pattern)
+    return [name for name in names if matches(name)]
+
+
+def test_plain_terms_match_as_case_insensitive_substrings():
+    assert matching("web", ["My-Web-App", "api", "webhooks"]) == [
+        "My-Web-App",
+        "webhooks",
+    ]
+
+
+def test_glob_terms_match_the_whole_name():
+    assert matching("web*", ["My-Web-App", "Webhooks"]) == ["Webhooks"]
+    assert matching("api-?", ["api-1", "api-10", "my-api-2"]) == ["api-1"]
+
+
+def test_comma_separated_terms_are_alternatives():
+    assert matching("api, web*", ["api-1", "Website", "docs"]) == ["api-1", "Website"]
+    assert _name_matcher(" , ") is None
+
+
+def test_brackets_make_a_term_a_glob():
+    # "[WIP]" is a character class matching one of W, I or P, not a substring
+    assert matching("[WIP]", ["[WIP] draft", "w", "P"]) == ["w", "P"]
+    assert matching("[[]WIP]*", ["[WIP] draft", "WIP"]) == ["[WIP] draft"]
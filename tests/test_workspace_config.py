@@ -0,0 +1,28 @@
+import json
+
+from claudesync.workspace_config import WorkspaceConfig
+
+
+def test_workspace_config_parses_unchanged_file_once(tmp_path, monkeypatch):
+    config_file = tmp_path / "workspace.json"
+    config_file.write_text(
+        json.dumps({"workspace_root": "/projects"}), encoding="utf-8"
+    )
+    monkeypatch.setattr(WorkspaceConfig, "CONFIG_FILE", str(config_file))
+    monkeypatch.setattr(WorkspaceConfig, "_parsed_cache", None)
+
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(json, "load", lambda f: loads.append(1) or real_load(f))
+
+    first = WorkspaceConfig()
+    first.config["exclude_patterns"].append("build")
+    second = WorkspaceConfig()
+
+    assert len(loads) == 1
+    assert second.get_workspace_root() == "/projects"
+    assert "build" not in second.config["exclude_patterns"]
+
+    second.set_max_search_depth(5)
+    assert WorkspaceConfig().config["max_search_depth"] == 5
+    assert len(loads) == 2
@@ -0,0 +1,287 @@
+import json
+import os
+
+from claudesync.workspace_manager import WorkspaceManager
+
+
+class DummyWorkspaceConfig:
+    def __init__(self, root):
+        self.root = str(root)
+        self.config = {}
+
+    def get_workspace_root(self):
+        return self.root
+
+
+def _make_project(root, name):
+    config_dir = root / name / ".claudesync"
+    config_dir.mkdir(parents=True)
+    config_file = config_dir / "config.local.json"
+    config_file.write_text(
+        json.dumps({"active_project_name": name, "active_project_id": name})
+    )
+    return config_file
+
+
+def test_cached_discovery_revalidates_known_projects(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        WorkspaceManager, "PROJECT_SET_FILE", str(tmp_path / "project_set.json")
+    )
+    workspace = tmp_path / "workspace"
+    config_file = _make_project(workspace, "alpha")
+    (workspace / "group").mkdir()
+
+    def discover():
+        # A fresh manager per call, as each command gets its own
+        return WorkspaceManager(DummyWorkspaceConfig(workspace)).discover_projects(
+            use_cache=True
+        )
+
+    assert [p["name"] for p in discover()] == ["alpha"]
+
+    # A cache hit skips the walk, so a project created deeper down isn't seen yet
+    _make_project(workspace / "group", "beta")
+    assert [p["name"] for p in discover()] == ["alpha"]
+
+    # Touching a known project's config makes the cache stale
+    stat = config_file.stat()
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+    assert [p["name"] for p in discover()] == ["alpha", "beta"]
+
+    # So does a new entry directly under the root
+    _make_project(workspace, "gamma")
+    assert sorted(p["name"] for p in discover()) == ["alpha", "beta", "gamma"]
+
+
+def test_discovery_respects_depth_and_exclusions(tmp_path):
+    workspace = tmp_path / "workspace"
+    _make_project(workspace, "alpha")
+    _make_project(workspace / "group", "beta")
+    _make_project(workspace / "a" / "b" / "c", "too_deep")
+    _make_project(workspace / "node_modules", "excluded")
+    _make_project(workspace / "alpha", "nested")
+    (workspace / "broken" / ".claudesync").mkdir(parents=True)
+    _make_project(workspace / "broken", "inner")
+
+    config = DummyWorkspaceConfig(workspace)
+    config.config = {"max_search_depth": 3, "exclude_patterns": ["node_modules"]}
+    projects = WorkspaceManager(config).discover_projects()
+
+    assert [p["relative_path"] for p in projects] == [
+        "alpha",
+        os.path.join("broken", "inner"),
+        os.path.join("group", "beta"),
+    ]
+
+
+def test_sync_all_projects_reports_each_result_as_it_finishes(tmp_path, monkeypatch):
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+    projects = [
+        {"name": name, "path": str(tmp_path / name)} for name in ("a", "b", "c")
+    ]
+    monkeypatch.setattr(
+        manager,
+        "_sync_single_project",
+        lambda project, options: {"project": project["name"], "status": "success"},
+    )
+
+    for parallel in (True, False):
+        streamed = []
+        results = manager.sync_all_projects(
+            projects,
+            {"parallel_workers": 2},
+            parallel=parallel,
+            on_result=streamed.append,
+        )
+        assert streamed == results
+        assert sorted(r["project"] for r in results) == ["a", "b", "c"]
+
+
+def test_sync_single_project_runs_in_process(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    _make_project(tmp_path, "a")
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+    calls = []
+
+    def fake_run_sync(config, **kwargs):
+        calls.append((config.get("prune_remote_files"), kwargs))
+
+    monkeypatch.setattr("claudesync.cli.sync.run_sync", fake_run_sync)
+
+    result = manager._sync_single_project(
+        {"name": "a", "path": str(tmp_path / "a")},
+        {"prune_remote": False, "push_only": True, "with_instructions": False},
+    )
+
+    assert result["status"] == "success"
+    assert calls == [
+        (
+            False,
+            {
+                "conflict_strategy": "local-wins",
+                "no_pull": True,
+                "no_push": False,
+                "interactive": False,
+                "quiet": True,
+            },
+        )
+    ]
+
+
+def test_pull_only_sync_keeps_local_wins(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    _make_project(tmp_path, "a")
+    calls = []
+    monkeypatch.setattr(
+        "claudesync.cli.sync.run_sync", lambda config, **kwargs: calls.append(kwargs)
+    )
+
+    result = WorkspaceManager(DummyWorkspaceConfig(tmp_path))._sync_single_project(
+        {"name": "a", "path": str(tmp_path / "a")},
+        {
+            "pull_only": True,
+            "conflict_strategy": "local-wins",
+            "with_instructions": False,
+        },
+    )
+
+    assert result["status"] == "success"
+    assert calls[0]["conflict_strategy"] == "local-wins"
+    assert calls[0]["no_push"] is True
+
+
+def test_sync_with_transfer_errors_is_reported_as_failed(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    _make_project(tmp_path, "a")
+    monkeypatch.setattr(
+        "claudesync.cli.sync.run_sync",
+        lambda config, **kwargs: {"uploaded": 0, "errors": ["a.txt: boom"]},
+    )
+
+    result = WorkspaceManager(DummyWorkspaceConfig(tmp_path))._sync_single_project(
+        {"name": "a", "path": str(tmp_path / "a")}, {"with_instructions": False}
+    )
+
+    assert result["status"] == "failed"
+    assert "a.txt: boom" in result["message"]
+
+
+def test_get_status_reports_watchers(tmp_path):
+    for name in ("a", "b"):
+        _make_project(tmp_path, name)
+    (tmp_path / "a" / ".claudesync" / "watch.pid").write_text(str(os.getpid()))
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+    projects = [
+        {"name": name, "path": str(tmp_path / name), "relative_path": name}
+        for name in ("a", "b")
+    ]
+
+    status = manager.get_status(projects)
+
+    assert [(p["name"], p["watcher"]) for p in status["projects"]] == [
+        ("a", "running"),
+        ("b", "stopped"),
+    ]
+
+
+def test_pull_all_chats_stops_at_first_failure(tmp_path, monkeypatch):
+    import subprocess
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    for name in ("a", "b", "c"):
+        _make_project(tmp_path, name)
+    projects = [
+        {"name": name, "path": str(tmp_path / name)} for name in ("a", "b", "c")
+    ]
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+
+    ran = []
+
+    def run(cmd, cwd=None, **kwargs):
+        name = os.path.basename(cwd)
+        ran.append(name)
+        return subprocess.CompletedProcess(cmd, 1 if name == "b" else 0, "", "boom")
+
+    monkeypatch.setattr(subprocess, "run", run)
+
+    results = manager.pull_all_chats(projects, {"skip_errors": False})
+    assert [(r["project"], r["status"]) for r in results] == [
+        ("a", "success"),
+        ("b", "failed"),
+    ]
+    assert ran == ["a", "b"]
+
+    ran.clear()
+    results = manager.pull_all_chats(projects, {"skip_errors": True})
+    assert [r["project"] for r in results] == ["a", "b", "c"]
+    assert ran == ["a", "b", "c"]
+
+
+def test_discovery_limit_stops_early(tmp_path):
+    for name in ("a", "b", "c", "d"):
+        _make_project(tmp_path, name)
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+
+    assert len(manager.discover_projects(limit=2)) == 2
+    assert len(manager.discover_projects(limit=10)) == 4
+
+
+def test_discovery_is_reused_until_root_changes(tmp_path, monkeypatch):
+    _make_project(tmp_path, "a")
+    manager = WorkspaceManager(DummyWorkspaceConfig(tmp_path))
+    walks = []
+    walk = manager._walk_projects
+    monkeypatch.setattr(
+        manager, "_walk_projects", lambda *args: walks.append(1) or walk(*args)
+    )
+
+    assert [p["name"] for p in manager.discover_projects()] == ["a"]
+    assert [p["name"] for p in manager.discover_projects()] == ["a"]
+    assert len(walks) == 1
+
+    _make_project(tmp_path, "b")
+    assert [p["name"] for p in manager.discover_projects()] == ["a", "b"]
+    assert len(walks) == 2
+
+    manager.invalidate_discovery()
+    manager.discover_projects()
+    assert len(walks) == 3
+
+
+def test_in_process_sync_skips_project_with_conflicts(tmp_path, monkeypatch):
+    from unittest.mock import Mock
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    project_dir = tmp_path / "a"
+    config_dir = project_dir / ".claudesync"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.local.json").write_text(
+        json.dumps(
+            {
+                "active_provider": "claude.ai",
+                "local_path": str(project_dir),
+                "active_organization_id": "org",
+                "active_project_id": "a",
+                "active_project_name": "a",
+            }
+        )
+    )
+    (project_dir / "changed.txt").write_text("local", encoding="utf-8")
+    provider = Mock()
+    provider.list_files_cached.return_value = [
+        {"uuid": "1", "file_name": "changed.txt", "content": "remote"}
+    ]
+    monkeypatch.setattr(
+        "claudesync.cli.sync.validate_and_get_provider", lambda *a, **k: provider
+    )
+    monkeypatch.setattr("click.confirm", Mock(side_effect=AssertionError("prompted")))
+
+    result = WorkspaceManager(DummyWorkspaceConfig(tmp_path))._sync_single_project(
+        {"name": "a", "path": str(project_dir)},
+        {"conflict_strategy": "prompt", "with_instructions": False},
+    )
+
+    assert result["status"] == "conflict"
+    assert "changed.txt" in result["message"]
+    provider.upload_file.assert_not_called()
+    assert (project_dir / "changed.txt").read_text(encoding="utf-8") == "local"